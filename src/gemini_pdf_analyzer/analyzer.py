@@ -4,12 +4,20 @@ Gemini analyzer module for PDF analysis.
 Handles interaction with Google Gemini API for document analysis.
 """
 
+import asyncio
+import functools
 import logging
+import random
+import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
 from typing import Callable, Dict, List, Optional
 
 from google import genai
 from google.genai import types
+from pydantic import BaseModel, TypeAdapter, ValidationError
 from tqdm import tqdm
 
 from .config import AppConfig
@@ -20,143 +28,342 @@ logger = logging.getLogger(__name__)
 # Retry configuration
 MAX_RETRIES = 3
 RETRY_DELAY_SECONDS = 2
+MAX_RETRY_DELAY_SECONDS = 60.0
 
-# Analysis prompt template
+# Rough chars-per-token ratio for English text, used to convert a token
+# budget into a character cap without a tokenizer round-trip
+CHARS_PER_TOKEN = 4
+
+# Analysis prompt template. The response shape is enforced via
+# response_schema, so no format instructions are needed here.
 ANALYSIS_PROMPT = """Analyze the following document and provide a structured analysis.
 
 DOCUMENT TEXT:
 {document_text}
 
-Please provide your analysis in the following format:
+Provide:
+- summary: a concise 2-3 sentence summary of the document's main content and purpose
+- key_entities: the key people, organizations, dates, and important terms mentioned
+- action_items: any action items, tasks, or recommendations found in the document \
+("None identified" if there are none)
+- keywords: 5-10 relevant keywords that describe this document"""
+
+# Pre-split so building a prompt is two concatenations instead of
+# re-templating the whole string per document
+_PROMPT_PREFIX, _PROMPT_SUFFIX = ANALYSIS_PROMPT.split("{document_text}")
+
+
+# Batch prompt template: documents are delimited with <doc id="..."> blocks
+# and the response schema asks for one analysis per id
+BATCH_ANALYSIS_PROMPT = """Analyze each of the following documents and provide a structured \
+analysis per document.
+
+{documents}
+
+For every document, provide:
+- id: the numeric id from the document's <doc> tag
+- summary: a concise 2-3 sentence summary of the document's main content and purpose
+- key_entities: the key people, organizations, dates, and important terms mentioned
+- action_items: any action items, tasks, or recommendations found in the document \
+("None identified" if there are none)
+- keywords: 5-10 relevant keywords that describe this document
+
+Return one analysis for each document, in the same order as the documents appear."""
+
 
-SUMMARY:
-[A concise 2-3 sentence summary of the document's main content and purpose]
+class Analysis(BaseModel):
+    """Response schema for Gemini's structured JSON output."""
 
-KEY ENTITIES:
-[List the key people, organizations, dates, and important terms mentioned]
+    summary: str
+    key_entities: str
+    action_items: str
+    keywords: List[str]
 
-ACTION ITEMS:
-[List any action items, tasks, or recommendations found in the document. Write "None identified" if there are no action items]
 
-KEYWORDS:
-[Comma-separated list of 5-10 relevant keywords that describe this document]
+class BatchAnalysis(Analysis):
+    """Analysis schema item for batched prompts, keyed back to a document id."""
 
-Respond only with the analysis in the exact format above."""
+    id: int
 
 
-def create_client(api_key: str) -> genai.Client:
+# Sent with every request so Gemini returns validated JSON instead of
+# free-form text that has to be re-parsed
+GENERATION_CONFIG = types.GenerateContentConfig(
+    response_mime_type="application/json",
+    response_schema=Analysis,
+)
+
+BATCH_GENERATION_CONFIG = types.GenerateContentConfig(
+    response_mime_type="application/json",
+    response_schema=List[BatchAnalysis],
+)
+
+_BATCH_LIST = TypeAdapter(List[BatchAnalysis])
+
+
+class TokenBucket:
+    """
+    Thread-safe token-bucket rate limiter with AIMD adaptation.
+
+    Tokens refill continuously at the configured requests-per-minute rate
+    (monotonic-clock accounting). On a rate-limit error the rate is halved
+    (multiplicative decrease); after a run of consecutive successes it
+    recovers additively back toward the configured rate.
+    """
+
+    # Consecutive successes required before the rate is raised again
+    SUCCESS_THRESHOLD = 5
+
+    def __init__(self, requests_per_minute: int) -> None:
+        self._target_rate = max(requests_per_minute, 1) / 60.0
+        self._rate = self._target_rate
+        self._capacity = max(1.0, self._target_rate)
+        self._tokens = self._capacity
+        self._last_refill = time.monotonic()
+        self._successes = 0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a token is available, then consume it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._capacity,
+                    self._tokens + (now - self._last_refill) * self._rate,
+                )
+                self._last_refill = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                wait = (1.0 - self._tokens) / self._rate
+            time.sleep(wait)
+
+    def multiplicative_decrease(self, factor: float = 0.5) -> None:
+        """Halve the request rate after a rate-limit error."""
+        with self._lock:
+            # Never drop below one request per minute
+            self._rate = max(self._rate * factor, 1.0 / 60.0)
+            self._successes = 0
+            logger.debug(f"Rate limit hit, reduced rate to {self._rate * 60:.1f} rpm")
+
+    def record_success(self) -> None:
+        """Additively recover the rate after consecutive successes."""
+        with self._lock:
+            if self._rate >= self._target_rate:
+                return
+            self._successes += 1
+            if self._successes >= self.SUCCESS_THRESHOLD:
+                self._rate = min(self._target_rate, self._rate + 1.0 / 60.0)
+                self._successes = 0
+
+
+def _is_rate_limit_error(error: Exception) -> bool:
+    """Check whether an exception represents an API rate-limit (429) error."""
+    code = getattr(error, "code", None) or getattr(error, "status_code", None)
+    if code == 429:
+        return True
+    message = str(error)
+    return "RESOURCE_EXHAUSTED" in message or "429" in message
+
+
+def _is_retryable_error(error: Exception) -> bool:
+    """
+    Check whether an exception is worth retrying.
+
+    Timeouts, rate limits, and server-side errors are transient; other
+    4xx responses (bad request, invalid key, oversized prompt) are
+    permanent and retrying only wastes budget. Exceptions without a
+    status code (transport failures, SDK wrappers) stay retryable.
+    """
+    code = getattr(error, "code", None) or getattr(error, "status_code", None)
+    if isinstance(code, int):
+        return code in (408, 429) or code >= 500
+    return True
+
+
+def _retry_delay(attempt: int) -> float:
+    """Full-jitter exponential backoff delay for retry `attempt`."""
+    cap = min(MAX_RETRY_DELAY_SECONDS, RETRY_DELAY_SECONDS * (2 ** attempt))
+    return random.uniform(0, cap)
+
+
+def _retry_sleep(attempt: int) -> None:
+    """Sleep with full-jitter exponential backoff before retry `attempt`."""
+    time.sleep(_retry_delay(attempt))
+
+
+def create_client(api_key: str, max_concurrency: int = 4) -> genai.Client:
     """
     Initialize the Gemini API client.
-    
+
+    The underlying httpx transport is sized to the request concurrency and
+    keeps connections alive between calls, so parallel workers reuse warm
+    connections instead of paying TLS handshake cost per request.
+
     Args:
         api_key: Google Gemini API key
-        
+        max_concurrency: Maximum number of concurrent requests the
+            connection pool should support
+
     Returns:
         Configured Gemini client
     """
-    client = genai.Client(api_key=api_key)
+    import httpx
+
+    limits = httpx.Limits(
+        max_connections=max_concurrency,
+        max_keepalive_connections=max_concurrency,
+        keepalive_expiry=60,
+    )
+    http_options = types.HttpOptions(
+        timeout=60_000,  # milliseconds
+        client_args={"limits": limits},
+        async_client_args={"limits": limits},
+    )
+    client = genai.Client(api_key=api_key, http_options=http_options)
     logger.info("Gemini client initialized")
     return client
 
 
+# Single-pass scanner for the four section anchors in the response
+SECTION_RE = re.compile(
+    r"^(SUMMARY|KEY ENTITIES|ACTION ITEMS|KEYWORDS)\s*:\s*",
+    re.MULTILINE | re.IGNORECASE,
+)
+
+# Splits a comma-separated keyword list, consuming surrounding whitespace
+_KW_SPLIT = re.compile(r"\s*,\s*")
+
+def _dedup_keywords(keywords: List[str]) -> List[str]:
+    """Drop duplicate keywords, preserving first-seen order.
+
+    dict.fromkeys runs the whole dedup as one C-level hash pass, so
+    repeated keywords from the model cost nothing downstream.
+    """
+    return list(dict.fromkeys(keywords))
+
+
+# Maps uppercased section headers to PdfAnalysisResult field names
+_SECTION_KEYS = {
+    "SUMMARY": "summary",
+    "KEY ENTITIES": "key_entities",
+    "ACTION ITEMS": "action_items",
+    "KEYWORDS": "keywords",
+}
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_sections(response_text: str) -> tuple:
+    """
+    Extract (summary, key_entities, action_items, keywords) from a response.
+
+    Memoized: identical response texts (benchmark re-runs, retried
+    requests) skip the regex scan. Returns only immutable values so cache
+    hits can never leak shared mutable state.
+    """
+    # Locate all section anchors in one pass, then slice the text between
+    # consecutive anchors to get each section's body
+    sections: Dict[str, str] = {}
+    matches = list(SECTION_RE.finditer(response_text))
+    for i, match in enumerate(matches):
+        key = _SECTION_KEYS[match.group(1).upper()]
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(response_text)
+        body = response_text[match.end():end]
+        # Collapse internal line breaks/whitespace the way the prompt invites
+        sections[key] = " ".join(body.split())
+
+    summary = sections.get("summary", "")
+    key_entities = sections.get("key_entities", "")
+    action_items = sections.get("action_items", "")
+    keywords_text = sections.get("keywords", "")
+    keywords = _dedup_keywords([k for k in _KW_SPLIT.split(keywords_text.strip()) if k])
+
+    # Fallback: if no sections parsed, use raw response
+    if not any([summary, key_entities, action_items]):
+        summary = response_text[:500] if len(response_text) > 500 else response_text
+
+    return summary, key_entities, action_items, tuple(keywords)
+
+
 def _parse_response(response_text: str, filename: str) -> PdfAnalysisResult:
     """
     Parse the structured response from Gemini into a PdfAnalysisResult.
-    
+
+    The text parsing itself is memoized in _parse_sections; the result
+    object is constructed fresh per call because results are mutated
+    downstream (compact() clears raw_response after caching).
+
     Args:
         response_text: Raw response text from Gemini
         filename: Name of the analyzed file
-        
+
     Returns:
         Parsed PdfAnalysisResult
     """
-    # Initialize with defaults
-    summary = ""
-    key_entities = ""
-    action_items = ""
-    keywords: List[str] = []
-    
-    # Parse sections from response
-    current_section = None
-    current_content: List[str] = []
-    
-    for line in response_text.split("\n"):
-        line_stripped = line.strip()
-        line_upper = line_stripped.upper()
-        
-        if line_upper.startswith("SUMMARY:"):
-            if current_section:
-                _save_section(current_section, current_content, locals())
-            current_section = "summary"
-            current_content = [line_stripped[8:].strip()]
-        elif line_upper.startswith("KEY ENTITIES:"):
-            if current_section:
-                _save_section(current_section, current_content, locals())
-            current_section = "key_entities"
-            current_content = [line_stripped[13:].strip()]
-        elif line_upper.startswith("ACTION ITEMS:"):
-            if current_section:
-                _save_section(current_section, current_content, locals())
-            current_section = "action_items"
-            current_content = [line_stripped[13:].strip()]
-        elif line_upper.startswith("KEYWORDS:"):
-            if current_section:
-                _save_section(current_section, current_content, locals())
-            current_section = "keywords"
-            current_content = [line_stripped[9:].strip()]
-        elif current_section:
-            current_content.append(line_stripped)
-    
-    # Process final section
-    if current_section and current_content:
-        content_text = " ".join(c for c in current_content if c)
-        if current_section == "summary":
-            summary = content_text
-        elif current_section == "key_entities":
-            key_entities = content_text
-        elif current_section == "action_items":
-            action_items = content_text
-        elif current_section == "keywords":
-            keywords = [k.strip() for k in content_text.split(",") if k.strip()]
-    
-    # Fallback: if no sections parsed, use raw response
-    if not any([summary, key_entities, action_items]):
-        summary = response_text[:500] if len(response_text) > 500 else response_text
-    
+    summary, key_entities, action_items, keywords = _parse_sections(response_text)
+
     return PdfAnalysisResult(
         filename=filename,
         summary=summary,
         key_entities=key_entities,
         action_items=action_items,
-        keywords=keywords,
+        keywords=list(keywords),
+        raw_response=response_text,
+    )
+
+
+def _result_from_response(response_text: str, filename: str) -> PdfAnalysisResult:
+    """
+    Build a PdfAnalysisResult from a Gemini response.
+
+    Validates the structured JSON the response schema requests; responses
+    that aren't valid JSON (e.g. from models ignoring the schema) fall back
+    to the legacy section-header parser.
+    """
+    try:
+        analysis = Analysis.model_validate_json(response_text)
+    except ValidationError:
+        return _parse_response(response_text, filename)
+
+    return PdfAnalysisResult(
+        filename=filename,
+        summary=analysis.summary,
+        key_entities=analysis.key_entities,
+        action_items=analysis.action_items,
+        keywords=_dedup_keywords(analysis.keywords),
         raw_response=response_text,
     )
 
 
-def _save_section(section: str, content: List[str], local_vars: dict) -> None:
-    """Helper to save accumulated section content."""
-    content_text = " ".join(c for c in content if c)
-    if section == "summary":
-        local_vars["summary"] = content_text
-    elif section == "key_entities":
-        local_vars["key_entities"] = content_text
-    elif section == "action_items":
-        local_vars["action_items"] = content_text
+def _empty_document_result(filename: str) -> PdfAnalysisResult:
+    """Build the API-free error result for a document with no text."""
+    logger.warning(f"Empty document: {filename}")
+    return PdfAnalysisResult(
+        filename=filename,
+        summary="Document contains no extractable text",
+        key_entities="",
+        action_items="",
+        keywords=[],
+        error="Empty document",
+    )
 
 
 def analyze_document(
     client: genai.Client,
     doc: PdfDocument,
-    config: AppConfig
+    config: AppConfig,
+    limiter: Optional[TokenBucket] = None,
 ) -> PdfAnalysisResult:
     """
     Analyze a single document using Gemini.
-    
+
     Args:
         client: Initialized Gemini client
         doc: PDF document to analyze
         config: Application configuration
-        
+        limiter: Optional rate limiter applied before each API call
+
     Returns:
         Analysis result for the document
     """
@@ -164,46 +371,54 @@ def analyze_document(
     
     # Handle empty documents
     if not doc.text.strip():
-        logger.warning(f"Empty document: {doc.filename}")
-        return PdfAnalysisResult(
-            filename=doc.filename,
-            summary="Document contains no extractable text",
-            key_entities="",
-            action_items="",
-            keywords=[],
-            error="Empty document",
-        )
-    
-    # Truncate text if needed
+        return _empty_document_result(doc.filename)
+
+    # Truncate text if needed. A configured token budget tightens the
+    # character cap so oversized prompts are cut before the API rejects
+    # them with a wasted round-trip
+    max_chars = config.max_chars_per_doc
+    if config.max_input_tokens is not None:
+        max_chars = min(max_chars, config.max_input_tokens * CHARS_PER_TOKEN)
+
     text = doc.text
-    if len(text) > config.max_chars_per_doc:
-        text = text[:config.max_chars_per_doc]
-        logger.debug(f"Truncated {doc.filename} to {config.max_chars_per_doc} characters")
+    if len(text) > max_chars:
+        text = text[:max_chars]
+        logger.debug(f"Truncated {doc.filename} to {max_chars} characters")
     
-    # Build prompt
-    prompt = ANALYSIS_PROMPT.format(document_text=text)
+    # Build prompt (concatenation avoids re-templating the full prompt)
+    prompt = _PROMPT_PREFIX + text + _PROMPT_SUFFIX
     
     # Call Gemini with retries
     last_error: Optional[Exception] = None
     for attempt in range(MAX_RETRIES):
         try:
+            if limiter is not None:
+                limiter.acquire()
             response = client.models.generate_content(
                 model=config.model_name,
                 contents=prompt,
+                config=GENERATION_CONFIG,
             )
-            
+
             if response.text:
-                result = _parse_response(response.text, doc.filename)
+                result = _result_from_response(response.text, doc.filename)
                 logger.debug(f"Successfully analyzed: {doc.filename}")
+                if limiter is not None:
+                    limiter.record_success()
                 return result
             else:
                 raise ValueError("Empty response from Gemini")
-                
+
         except Exception as e:
             last_error = e
+            if limiter is not None and _is_rate_limit_error(e):
+                limiter.multiplicative_decrease()
+            if not _is_retryable_error(e):
+                logger.warning(f"Non-retryable error for {doc.filename}: {e}")
+                break
             logger.warning(f"Attempt {attempt + 1}/{MAX_RETRIES} failed for {doc.filename}: {e}")
             if attempt < MAX_RETRIES - 1:
-                time.sleep(RETRY_DELAY_SECONDS * (attempt + 1))
+                _retry_sleep(attempt)
     
     # All retries failed
     logger.error(f"Failed to analyze {doc.filename} after {MAX_RETRIES} attempts")
@@ -217,68 +432,357 @@ def analyze_document(
     )
 
 
+async def analyze_document_async(
+    client: genai.Client,
+    doc: PdfDocument,
+    config: AppConfig,
+    limiter: Optional[TokenBucket] = None,
+) -> PdfAnalysisResult:
+    """
+    Async variant of analyze_document, using the SDK's aio surface.
+
+    Identical request shape, retry policy, and rate limiting, but awaits
+    the API call so many requests can be in flight on one event loop.
+
+    Args:
+        client: Initialized Gemini client
+        doc: PDF document to analyze
+        config: Application configuration
+        limiter: Optional rate limiter applied before each API call
+
+    Returns:
+        Analysis result for the document
+    """
+    logger.debug(f"Analyzing: {doc.filename}")
+
+    if not doc.text.strip():
+        return _empty_document_result(doc.filename)
+
+    max_chars = config.max_chars_per_doc
+    if config.max_input_tokens is not None:
+        max_chars = min(max_chars, config.max_input_tokens * CHARS_PER_TOKEN)
+
+    text = doc.text
+    if len(text) > max_chars:
+        text = text[:max_chars]
+        logger.debug(f"Truncated {doc.filename} to {max_chars} characters")
+
+    prompt = _PROMPT_PREFIX + text + _PROMPT_SUFFIX
+
+    last_error: Optional[Exception] = None
+    for attempt in range(MAX_RETRIES):
+        try:
+            if limiter is not None:
+                # TokenBucket blocks while waiting for a token; run it in a
+                # worker thread so the event loop keeps serving other tasks
+                await asyncio.to_thread(limiter.acquire)
+            response = await client.aio.models.generate_content(
+                model=config.model_name,
+                contents=prompt,
+                config=GENERATION_CONFIG,
+            )
+
+            if response.text:
+                result = _result_from_response(response.text, doc.filename)
+                logger.debug(f"Successfully analyzed: {doc.filename}")
+                if limiter is not None:
+                    limiter.record_success()
+                return result
+            else:
+                raise ValueError("Empty response from Gemini")
+
+        except Exception as e:
+            last_error = e
+            if limiter is not None and _is_rate_limit_error(e):
+                limiter.multiplicative_decrease()
+            if not _is_retryable_error(e):
+                logger.warning(f"Non-retryable error for {doc.filename}: {e}")
+                break
+            logger.warning(f"Attempt {attempt + 1}/{MAX_RETRIES} failed for {doc.filename}: {e}")
+            if attempt < MAX_RETRIES - 1:
+                await asyncio.sleep(_retry_delay(attempt))
+
+    logger.error(f"Failed to analyze {doc.filename} after {MAX_RETRIES} attempts")
+    return PdfAnalysisResult(
+        filename=doc.filename,
+        summary="",
+        key_entities="",
+        action_items="",
+        keywords=[],
+        error=str(last_error) if last_error else "Unknown error",
+    )
+
+
+async def analyze_documents_async(
+    client: genai.Client,
+    documents: List[PdfDocument],
+    config: AppConfig,
+) -> List[PdfAnalysisResult]:
+    """
+    Analyze documents concurrently on an event loop.
+
+    Runs up to config.max_concurrency requests in flight at once via a
+    semaphore-bounded gather, turning N sequential round-trips into
+    roughly N / max_concurrency. Caching and prompt batching stay on the
+    sync analyze_documents path, which the CLI uses; this entrypoint is
+    for callers already running inside asyncio.
+
+    Args:
+        client: Initialized Gemini client
+        documents: PDF documents to analyze
+        config: Application configuration
+
+    Returns:
+        List of analysis results, in the same order as `documents`
+    """
+    limiter = TokenBucket(config.requests_per_minute)
+    semaphore = asyncio.Semaphore(config.max_concurrency)
+
+    async def analyze(doc: PdfDocument) -> PdfAnalysisResult:
+        async with semaphore:
+            return await analyze_document_async(client, doc, config, limiter)
+
+    return list(await asyncio.gather(*(analyze(doc) for doc in documents)))
+
+
+def analyze_batch(
+    client: genai.Client,
+    docs: List[PdfDocument],
+    config: AppConfig,
+    limiter: Optional[TokenBucket] = None,
+) -> List[PdfAnalysisResult]:
+    """
+    Analyze several documents in a single Gemini request.
+
+    Packs the documents into one prompt with <doc id="..."> delimiters and
+    asks for a JSON array of per-document analyses. If the batched call
+    fails or the response can't be mapped back to every document, falls
+    back to analyzing each document individually.
+
+    Args:
+        client: Initialized Gemini client
+        docs: PDF documents to analyze together
+        config: Application configuration
+        limiter: Optional rate limiter applied before each API call
+
+    Returns:
+        Analysis results in the same order as `docs`
+    """
+    if len(docs) == 1:
+        return [analyze_document(client, docs[0], config, limiter)]
+
+    blocks = "\n\n".join(
+        f'<doc id="{i}" filename="{doc.filename}">\n{doc.text}\n</doc>'
+        for i, doc in enumerate(docs)
+    )
+    prompt = BATCH_ANALYSIS_PROMPT.format(documents=blocks)
+
+    last_error: Optional[Exception] = None
+    for attempt in range(MAX_RETRIES):
+        try:
+            if limiter is not None:
+                limiter.acquire()
+            response = client.models.generate_content(
+                model=config.model_name,
+                contents=prompt,
+                config=BATCH_GENERATION_CONFIG,
+            )
+
+            if not response.text:
+                raise ValueError("Empty response from Gemini")
+
+            analyses = _BATCH_LIST.validate_json(response.text)
+            by_id = {a.id: a for a in analyses}
+            if set(by_id) != set(range(len(docs))):
+                raise ValueError(
+                    f"Batch response ids {sorted(by_id)} do not cover all {len(docs)} documents"
+                )
+
+            if limiter is not None:
+                limiter.record_success()
+            logger.debug(f"Successfully analyzed batch of {len(docs)} documents")
+            return [
+                PdfAnalysisResult(
+                    filename=doc.filename,
+                    summary=by_id[i].summary,
+                    key_entities=by_id[i].key_entities,
+                    action_items=by_id[i].action_items,
+                    keywords=_dedup_keywords(by_id[i].keywords),
+                    raw_response=response.text,
+                )
+                for i, doc in enumerate(docs)
+            ]
+
+        except Exception as e:
+            last_error = e
+            if limiter is not None and _is_rate_limit_error(e):
+                limiter.multiplicative_decrease()
+            if not _is_retryable_error(e):
+                logger.warning(f"Non-retryable error for batch of {len(docs)}: {e}")
+                break
+            logger.warning(
+                f"Attempt {attempt + 1}/{MAX_RETRIES} failed for batch of {len(docs)}: {e}"
+            )
+            if attempt < MAX_RETRIES - 1:
+                _retry_sleep(attempt)
+
+    # Batched analysis failed; fall back to one request per document
+    logger.warning(
+        f"Batch analysis failed after {MAX_RETRIES} attempts ({last_error}), "
+        "falling back to per-document requests"
+    )
+    return [analyze_document(client, doc, config, limiter) for doc in docs]
+
+
+def _group_into_batches(
+    pending: List[tuple],
+    config: AppConfig,
+) -> List[List[tuple]]:
+    """
+    Group (index, document) pairs into prompt batches.
+
+    Documents are packed greedily up to `config.batch_size` per batch while
+    their combined text stays within the per-request character budget —
+    `config.max_chars_per_doc`, tightened by a configured token budget the
+    same way the single-document path tightens it. Documents too large to
+    share a prompt get a batch of their own.
+    """
+    char_budget = config.max_chars_per_doc
+    if config.max_input_tokens is not None:
+        char_budget = min(char_budget, config.max_input_tokens * CHARS_PER_TOKEN)
+    per_doc_cap = char_budget // config.batch_size
+
+    batches: List[List[tuple]] = []
+    current: List[tuple] = []
+    current_chars = 0
+
+    for index, doc in pending:
+        text_len = len(doc.text)
+        if text_len > per_doc_cap:
+            # Too large to share a prompt; analyze individually
+            batches.append([(index, doc)])
+            continue
+        if current and (
+            len(current) >= config.batch_size or current_chars + text_len > char_budget
+        ):
+            batches.append(current)
+            current = []
+            current_chars = 0
+        current.append((index, doc))
+        current_chars += text_len
+
+    if current:
+        batches.append(current)
+
+    return batches
+
+
 def analyze_documents(
     client: genai.Client,
     documents: List[PdfDocument],
     config: AppConfig,
     cache: Optional[Dict[str, dict]] = None,
     cache_callback: Optional[Callable[[PdfDocument, PdfAnalysisResult], None]] = None,
-    show_progress: bool = True
+    show_progress: bool = True,
+    cache_dir: Optional[Path] = None,
 ) -> List[PdfAnalysisResult]:
     """
-    Analyze multiple documents with optional caching.
-    
+    Analyze multiple documents concurrently with optional caching.
+
+    Gemini calls are I/O-bound, so cache misses are dispatched to a thread
+    pool with at most ``config.max_concurrency`` requests in flight. Result
+    ordering matches the input document ordering regardless of completion
+    order.
+
     Args:
-        client: Initialized Gemini client  
+        client: Initialized Gemini client
         documents: List of PDF documents to analyze
         config: Application configuration
         cache: Optional cache dictionary for skipping unchanged files
         cache_callback: Optional callback to update cache after each analysis
         show_progress: Whether to show a progress bar
-        
+        cache_dir: If given, new results are appended to the on-disk cache
+            log as they complete
+
     Returns:
-        List of analysis results
+        List of analysis results, in the same order as `documents`
     """
     from .cache import get_cached_result, cache_result
-    
-    results = []
+
     total = len(documents)
+    results: List[Optional[PdfAnalysisResult]] = [None] * total
     cached_count = 0
-    
-    # Create progress bar
-    iterator = tqdm(
-        documents,
-        desc="Analyzing PDFs",
-        unit="doc",
-        disable=not show_progress
-    )
-    
-    for doc in iterator:
-        iterator.set_postfix_str(doc.filename[:25])
-        
-        # Check cache first
+
+    # Resolve cache hits up front so only misses hit the API
+    pending: List[tuple] = []
+    for index, doc in enumerate(documents):
         cached_result = None
         if cache is not None:
             cached_result = get_cached_result(cache, doc)
-        
+
         if cached_result is not None:
-            results.append(cached_result)
+            results[index] = cached_result
             cached_count += 1
             logger.debug(f"Using cached result for: {doc.filename}")
+        elif not doc.text.strip():
+            # Same API-free short-circuit as analyze_document, applied here
+            # so empty documents are never packed into batch prompts
+            results[index] = _empty_document_result(doc.filename)
         else:
-            result = analyze_document(client, doc, config)
-            results.append(result)
-            
-            # Update cache
-            if cache is not None:
-                cache_result(cache, doc, result)
-            if cache_callback:
-                cache_callback(doc, result)
-            
-            # Small delay between API calls to avoid rate limiting
-            time.sleep(0.5)
-    
-    successful = sum(1 for r in results if r.is_successful)
+            pending.append((index, doc))
+
+    # Create progress bar over the documents that actually need analysis
+    # mininterval keeps terminal writes from serializing with worker
+    # threads; postfix is only refreshed as futures complete
+    progress = tqdm(
+        total=len(pending),
+        desc="Analyzing PDFs",
+        unit="doc",
+        disable=not show_progress,
+        mininterval=1.0,
+        smoothing=0.3,
+    )
+
+    limiter = TokenBucket(config.requests_per_minute)
+
+    # With batch_size > 1, short documents share a single prompt
+    if config.batch_size > 1:
+        batches = _group_into_batches(pending, config)
+    else:
+        batches = [[item] for item in pending]
+
+    with ThreadPoolExecutor(max_workers=config.max_concurrency) as executor:
+        futures = {
+            executor.submit(
+                analyze_batch, client, [doc for _, doc in batch], config, limiter
+            ): batch
+            for batch in batches
+        }
+
+        for future in as_completed(futures):
+            batch = futures[future]
+            for (index, doc), result in zip(batch, future.result()):
+                results[index] = result
+
+                # Update cache
+                if cache is not None:
+                    cache_result(cache, doc, result, cache_dir=cache_dir)
+                if cache_callback:
+                    cache_callback(doc, result)
+
+                # The raw response is only needed for caching; drop it so
+                # memory doesn't grow with response size times batch count
+                if not config.keep_raw_response:
+                    result.compact()
+
+                progress.set_postfix_str(doc.filename[:25])
+                progress.update(1)
+
+    progress.close()
+
+    successful = sum(1 for r in results if r is not None and r.is_successful)
     logger.info(f"Completed: {successful}/{total} successful, {cached_count} from cache")
-    
-    return results
+
+    # Every slot was filled by a cache hit or a completed batch; the
+    # comprehension narrows Optional away for callers (and the type checker)
+    return [result for result in results if result is not None]
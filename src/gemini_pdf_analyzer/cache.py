@@ -4,55 +4,183 @@ Caching module for Gemini PDF Analyzer.
 Provides file-based caching to avoid re-analyzing unchanged PDF files.
 """
 
+import base64
+import functools
 import hashlib
 import json
 import logging
+import mmap
+import os
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from .models import PdfAnalysisResult, PdfDocument
 
+# blake3 and zstandard are optional dependencies; fall back to the
+# stdlib equivalents when missing
+try:
+    import blake3
+except ImportError:
+    blake3 = None  # type: ignore[assignment]
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None  # type: ignore[assignment]
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
-CACHE_FILENAME = ".analysis_cache.json"
+# Rust-backed decode when orjson is available (it accepts str or bytes)
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _encode_line(record: dict) -> bytes:
+    """Serialize one cache log record to a newline-terminated bytes line."""
+    if orjson is not None:
+        return orjson.dumps(record) + b"\n"
+    return (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+
+CACHE_FILENAME = ".analysis_cache.jsonl"
+
+# Pre-JSONL cache file, read once for migration then superseded
+LEGACY_CACHE_FILENAME = ".analysis_cache.json"
+
+# Recorded in cache entries so results hashed with a different
+# algorithm are transparently invalidated
+HASH_ALGO = "blake3" if blake3 is not None else "blake2b"
 
 
 def _compute_file_hash(file_path: Path) -> str:
-    """Compute MD5 hash of a file for change detection."""
-    hasher = hashlib.md5()
+    """Compute a content hash of a file for change detection."""
+    if blake3 is not None:
+        # Memory-mapped, SIMD-accelerated hashing across all cores
+        # (mmap rejects empty files)
+        hasher = blake3.blake3(max_threads=blake3.blake3.AUTO)
+        if file_path.stat().st_size > 0:
+            hasher.update_mmap(file_path)
+        return hasher.hexdigest()
+
+    # blake2b is the fastest hashlib digest on 64-bit CPUs and, like
+    # blake3, is keyed purely for change detection here
+    hasher = hashlib.blake2b()
     with open(file_path, "rb") as f:
-        # Read in chunks for large files
-        for chunk in iter(lambda: f.read(8192), b""):
-            hasher.update(chunk)
+        try:
+            # One contiguous mmap'd update: no per-chunk syscalls or
+            # userspace copies (mmap rejects empty files)
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                hasher.update(mm)
+        except ValueError:
+            pass
     return hasher.hexdigest()
 
 
+@functools.lru_cache(maxsize=4096)
+def _hash_cached(path_str: str, mtime_ns: int, size: int) -> str:
+    """
+    Memoized file hash keyed on (path, mtime_ns, size).
+
+    Repeat lookups for an unchanged file within one process hit the LRU
+    instead of re-reading the file; any modification changes the stat
+    tuple and therefore the key, so invalidation is automatic.
+    """
+    return _compute_file_hash(Path(path_str))
+
+
 def _get_cache_path(cache_dir: Path) -> Path:
     """Get the path to the cache file."""
     return cache_dir / CACHE_FILENAME
 
 
+def _compress_raw_response(raw: str) -> Tuple[str, str]:
+    """Compress a raw Gemini response for storage; returns (codec, base64)."""
+    data = raw.encode("utf-8")
+    if zstandard is not None:
+        compressed = zstandard.ZstdCompressor(level=6).compress(data)
+        codec = "zstd"
+    else:
+        compressed = zlib.compress(data, 6)
+        codec = "zlib"
+    return codec, base64.b64encode(compressed).decode("ascii")
+
+
+def _decompress_raw_response(cached: dict) -> str:
+    """Recover the raw response from a cache entry (any storage format)."""
+    encoded = cached.get("raw_response_z")
+    if not encoded:
+        # Entries written before compression store it as plain text
+        plain: str = cached.get("raw_response", "")
+        return plain
+
+    codec = cached.get("raw_codec", "zlib")
+    try:
+        compressed = base64.b64decode(encoded)
+        if codec == "zstd":
+            if zstandard is None:
+                logger.debug("Cached raw_response is zstd but zstandard is unavailable")
+                return ""
+            return zstandard.ZstdDecompressor().decompress(compressed).decode("utf-8")
+        return zlib.decompress(compressed).decode("utf-8")
+    except Exception as e:
+        logger.debug(f"Failed to decompress cached raw_response: {e}")
+        return ""
+
+
+# Per-run memo of (stat_result, file_hash) captured during a cache miss so
+# the follow-up cache_result for the same file doesn't stat/hash it again.
+# Keyed by str(path); entries are popped when consumed. Not an lru_cache on
+# the path alone because that would serve stale stats for modified files.
+_lookup_memo: Dict[str, tuple] = {}
+
+
 def load_cache(cache_dir: Path) -> Dict[str, dict]:
     """
     Load the analysis cache from disk.
-    
+
+    The cache is an append-only JSONL log with one ``{"key", "entry"}``
+    object per line; replay keeps the last entry per key. A legacy
+    single-JSON cache file is read as a fallback and migrated on the next
+    save.
+
     Args:
         cache_dir: Directory containing the cache file
-        
+
     Returns:
         Dictionary mapping filenames to cached data
     """
     cache_path = _get_cache_path(cache_dir)
-    
+    cache: Dict[str, dict] = {}
+
     if not cache_path.exists():
+        legacy_path = cache_dir / LEGACY_CACHE_FILENAME
+        if legacy_path.exists():
+            try:
+                with open(legacy_path, "r", encoding="utf-8") as f:
+                    cache = json.load(f)
+                logger.info(f"Loaded {len(cache)} cached results from legacy cache")
+                return cache
+            except Exception as e:
+                logger.warning(f"Failed to load legacy cache: {e}")
+                return {}
         logger.debug("No cache file found, starting fresh")
         return {}
-    
+
     try:
-        with open(cache_path, "r", encoding="utf-8") as f:
-            cache = json.load(f)
+        with open(cache_path, "rb") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                record = _loads(line)
+                cache[record["key"]] = record["entry"]
         logger.info(f"Loaded {len(cache)} cached results from {cache_path}")
         return cache
     except Exception as e:
@@ -62,21 +190,67 @@ def load_cache(cache_dir: Path) -> Dict[str, dict]:
 
 def save_cache(cache_dir: Path, cache: Dict[str, dict]) -> None:
     """
-    Save the analysis cache to disk.
-    
+    Save (and compact) the analysis cache to disk.
+
+    Rewrites the JSONL log with exactly one line per key, discarding any
+    superseded entries appended during the run.
+
     Args:
         cache_dir: Directory to save the cache file
         cache: Cache dictionary to save
     """
     cache_path = _get_cache_path(cache_dir)
     cache_dir.mkdir(parents=True, exist_ok=True)
-    
+
     try:
-        with open(cache_path, "w", encoding="utf-8") as f:
-            json.dump(cache, f, ensure_ascii=False, indent=2)
+        with open(cache_path, "wb") as f:
+            for key, entry in cache.items():
+                f.write(_encode_line({"key": key, "entry": entry}))
         logger.info(f"Saved {len(cache)} results to cache")
     except Exception as e:
         logger.warning(f"Failed to save cache: {e}")
+    finally:
+        _lookup_memo.clear()
+
+
+def append_cache_entry(cache_dir: Path, key: str, entry: dict) -> None:
+    """
+    Append a single cache entry to the JSONL log.
+
+    Called as each result completes so a crash mid-batch loses nothing;
+    the end-of-run save_cache rewrite compacts any duplicate keys.
+
+    Args:
+        cache_dir: Directory containing the cache file
+        key: Cache key (document filename)
+        entry: Cache entry for the key
+    """
+    cache_path = _get_cache_path(cache_dir)
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        with open(cache_path, "ab") as f:
+            f.write(_encode_line({"key": key, "entry": entry}))
+    except Exception as e:
+        logger.warning(f"Failed to append cache entry for {key}: {e}")
+
+
+def _restore_result(cached: dict, filename: str) -> Optional[PdfAnalysisResult]:
+    """Reconstruct a PdfAnalysisResult from a cache entry."""
+    try:
+        result = PdfAnalysisResult(
+            filename=cached["filename"],
+            summary=cached["summary"],
+            key_entities=cached["key_entities"],
+            action_items=cached["action_items"],
+            keywords=cached.get("keywords", []),
+            raw_response=_decompress_raw_response(cached),
+            error=cached.get("error"),
+        )
+        logger.debug(f"Cache hit: {filename}")
+        return result
+    except Exception as e:
+        logger.debug(f"Failed to restore cached result for {filename}: {e}")
+        return None
 
 
 def get_cached_result(
@@ -85,76 +259,180 @@ def get_cached_result(
 ) -> Optional[PdfAnalysisResult]:
     """
     Get a cached result if the file hasn't changed.
-    
+
     Args:
         cache: Cache dictionary
         doc: PDF document to check
-        
+
     Returns:
         Cached PdfAnalysisResult if valid, None if not cached or changed
     """
     if doc.filename not in cache:
         return None
-    
+
     cached = cache[doc.filename]
-    
-    # Verify file hasn't changed by comparing hash
+
+    try:
+        st = doc.path.stat()
+    except OSError:
+        return None
+
+    # Fast path: unchanged (size, mtime_ns) means unchanged content — skip hashing
+    if cached.get("size") == st.st_size and cached.get("mtime_ns") == st.st_mtime_ns:
+        return _restore_result(cached, doc.filename)
+
+    # Entries hashed with a different algorithm can't be verified; treat as miss
+    if cached.get("hash_algo", "md5") != HASH_ALGO:
+        logger.debug(f"Cache miss (hash algorithm changed): {doc.filename}")
+        _lookup_memo[str(doc.path)] = (st, None)
+        return None
+
+    # Slow path: stat differs, verify content via hash
     try:
-        current_hash = _compute_file_hash(doc.path)
+        current_hash = _hash_cached(str(doc.path), st.st_mtime_ns, st.st_size)
         if cached.get("file_hash") != current_hash:
             logger.debug(f"Cache miss (file changed): {doc.filename}")
+            _lookup_memo[str(doc.path)] = (st, current_hash)
             return None
     except Exception:
         return None
-    
-    # Reconstruct the result
-    try:
-        result = PdfAnalysisResult(
-            filename=cached["filename"],
-            summary=cached["summary"],
-            key_entities=cached["key_entities"],
-            action_items=cached["action_items"],
-            keywords=cached.get("keywords", []),
-            raw_response=cached.get("raw_response", ""),
-            error=cached.get("error"),
-        )
-        logger.debug(f"Cache hit: {doc.filename}")
-        return result
-    except Exception as e:
-        logger.debug(f"Failed to restore cached result for {doc.filename}: {e}")
-        return None
+
+    # Content matches despite a stat change (e.g. touch); refresh the stat fields
+    cached["size"] = st.st_size
+    cached["mtime_ns"] = st.st_mtime_ns
+
+    return _restore_result(cached, doc.filename)
 
 
 def cache_result(
     cache: Dict[str, dict],
     doc: PdfDocument,
-    result: PdfAnalysisResult
+    result: PdfAnalysisResult,
+    cache_dir: Optional[Path] = None,
 ) -> None:
     """
     Add or update a result in the cache.
-    
+
     Args:
         cache: Cache dictionary to update
         doc: PDF document that was analyzed
         result: Analysis result to cache
+        cache_dir: If given, also append the entry to the on-disk JSONL log
+            immediately so it survives a crash mid-run
     """
     try:
-        file_hash = _compute_file_hash(doc.path)
-        cache[doc.filename] = {
+        # Reuse the stat/hash captured when this file missed the cache
+        memo = _lookup_memo.pop(str(doc.path), None)
+        if memo is not None:
+            st, file_hash = memo
+        else:
+            st = doc.path.stat()
+            file_hash = None
+        if file_hash is None:
+            file_hash = _hash_cached(str(doc.path), st.st_mtime_ns, st.st_size)
+        entry = {
             "filename": result.filename,
             "summary": result.summary,
             "key_entities": result.key_entities,
             "action_items": result.action_items,
             "keywords": result.keywords,
-            "raw_response": result.raw_response,
             "error": result.error,
             "file_hash": file_hash,
+            "hash_algo": HASH_ALGO,
+            "size": st.st_size,
+            "mtime_ns": st.st_mtime_ns,
             "cached_at": datetime.now().isoformat(),
         }
+        if result.raw_response:
+            entry["raw_codec"], entry["raw_response_z"] = _compress_raw_response(
+                result.raw_response
+            )
+        cache[doc.filename] = entry
+        if cache_dir is not None:
+            append_cache_entry(cache_dir, doc.filename, entry)
     except Exception as e:
         logger.warning(f"Failed to cache result for {doc.filename}: {e}")
 
 
+def _upgrade_entry_hash(cache: Dict[str, dict], doc: PdfDocument) -> bool:
+    """
+    Upgrade a cache entry hashed with a superseded algorithm.
+
+    The old digest can't be verified against the current algorithm, but
+    if the stored result payload still restores, the entry is worth
+    keeping: re-hash the file and refresh the hash and stat fields so
+    the entry survives the algorithm transition instead of forcing a
+    re-analysis.
+
+    Returns:
+        True if the entry was upgraded
+    """
+    cached = cache.get(doc.filename)
+    if cached is None or cached.get("hash_algo", "md5") == HASH_ALGO:
+        return False
+    if _restore_result(cached, doc.filename) is None:
+        return False
+
+    try:
+        st = doc.path.stat()
+        cached["file_hash"] = _hash_cached(str(doc.path), st.st_mtime_ns, st.st_size)
+    except OSError:
+        return False
+
+    cached["hash_algo"] = HASH_ALGO
+    cached["size"] = st.st_size
+    cached["mtime_ns"] = st.st_mtime_ns
+    # Drop the miss memo the lookup recorded; the entry is a hit now
+    _lookup_memo.pop(str(doc.path), None)
+    logger.debug(f"Cache entry re-hashed with {HASH_ALGO}: {doc.filename}")
+    return True
+
+
+def warm_cache(
+    cache: Dict[str, dict],
+    documents: List[PdfDocument],
+    present_filenames: Optional[set] = None,
+) -> int:
+    """
+    Warm the cache against the current input set without calling Gemini.
+
+    Prunes entries whose files no longer exist, then verifies the
+    remaining documents in parallel; verification refreshes the stat
+    fast-path fields for entries whose content still matches, and
+    entries hashed with a superseded algorithm are re-hashed in place,
+    so the next real run starts all-hit for unchanged files.
+
+    Args:
+        cache: Cache dictionary to warm (modified in place)
+        documents: Documents to verify against the cache
+        present_filenames: Full set of filenames currently on disk,
+            used as the prune survivor set. Defaults to the filenames of
+            `documents`; pass the unfiltered directory listing when
+            `documents` is a filtered or truncated subset, so entries
+            for excluded files aren't pruned
+
+    Returns:
+        Number of stale entries pruned
+    """
+    if present_filenames is None:
+        present_filenames = {doc.filename for doc in documents}
+    pruned = 0
+    for key in list(cache):
+        if key not in present_filenames:
+            del cache[key]
+            pruned += 1
+
+    def verify(doc: PdfDocument) -> None:
+        if get_cached_result(cache, doc) is None:
+            _upgrade_entry_hash(cache, doc)
+
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        list(executor.map(verify, documents))
+
+    logger.info(f"Cache warmed: {len(cache)} entries kept, {pruned} stale entries pruned")
+    return pruned
+
+
 def clear_cache(cache_dir: Path) -> bool:
     """
     Clear the analysis cache.
@@ -165,10 +443,13 @@ def clear_cache(cache_dir: Path) -> bool:
     Returns:
         True if cache was cleared, False if no cache existed
     """
-    cache_path = _get_cache_path(cache_dir)
-    
-    if cache_path.exists():
-        cache_path.unlink()
+    cleared = False
+    for name in (CACHE_FILENAME, LEGACY_CACHE_FILENAME):
+        cache_path = cache_dir / name
+        if cache_path.exists():
+            cache_path.unlink()
+            cleared = True
+
+    if cleared:
         logger.info("Cache cleared")
-        return True
-    return False
+    return cleared
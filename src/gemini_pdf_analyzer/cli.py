@@ -6,14 +6,16 @@ Provides command-line interface for batch PDF analysis.
 
 import argparse
 import logging
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from .analyzer import analyze_documents, create_client
-from .cache import load_cache, save_cache, clear_cache
+from .cache import load_cache, save_cache, clear_cache, get_cached_result, warm_cache
 from .config import load_config
 from .exporter import export_results
-from .pdf_loader import load_pdfs
+from .pdf_loader import list_pdf_files, load_pdfs
 
 
 def setup_logging(verbose: bool = False, quiet: bool = False) -> None:
@@ -79,6 +81,18 @@ Examples:
         help="Maximum number of PDFs to process (default: all)",
     )
     
+    parser.add_argument(
+        "--max-concurrency", "-c",
+        type=int,
+        help="Maximum number of concurrent Gemini requests (default: 4)",
+    )
+
+    parser.add_argument(
+        "--batch-size", "-b",
+        type=int,
+        help="Number of short documents to pack into one Gemini prompt (default: 1)",
+    )
+
     parser.add_argument(
         "--filter", "-F",
         type=str,
@@ -89,7 +103,7 @@ Examples:
     parser.add_argument(
         "--format", "-f",
         nargs="+",
-        choices=["csv", "json", "jsonl", "excel"],
+        choices=["csv", "json", "jsonl", "excel", "arrow"],
         default=["csv", "jsonl"],
         help="Output formats (default: csv jsonl)",
     )
@@ -105,6 +119,12 @@ Examples:
         action="store_true",
         help="Clear cached results and exit",
     )
+
+    parser.add_argument(
+        "--warm-cache",
+        action="store_true",
+        help="Verify cached results against input files, prune stale entries, and exit",
+    )
     
     parser.add_argument(
         "--no-progress",
@@ -155,6 +175,8 @@ def main() -> int:
             output_dir=args.output_dir,
             model_name=args.model_name,
             max_docs=args.max_docs,
+            max_concurrency=args.max_concurrency,
+            batch_size=args.batch_size,
         )
         
         # Handle clear-cache command
@@ -186,25 +208,67 @@ def main() -> int:
             return 0
         
         logger.info(f"Loaded {len(documents)} document(s)")
-        
+
         # Load cache (unless disabled)
         cache = None
         if not args.no_cache:
             cache = load_cache(config.input_dir)
+
+        # Handle warm-cache command: verify/prune without calling Gemini.
+        # The prune survivor set comes from the unfiltered directory listing
+        # so --filter/--max-docs only narrow what gets verified, not which
+        # entries survive the prune
+        if args.warm_cache:
+            if cache is None:
+                cache = load_cache(config.input_dir)
+            present = {path.name for path in list_pdf_files(config.input_dir)}
+            warm_cache(cache, documents, present_filenames=present)
+            save_cache(config.input_dir, cache)
+            return 0
         
         # Create Gemini client
         logger.info("Initializing Gemini client...")
-        client = create_client(config.gemini_api_key)
+        client = create_client(config.gemini_api_key, config.max_concurrency)
         
+        # Classify documents as cache hit/miss in parallel so stat/hash work
+        # overlaps across cores before any Gemini call is made
+        cached_results = {}
+        pending_docs = documents
+        if cache:
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                classified = executor.map(
+                    lambda doc: get_cached_result(cache, doc), documents
+                )
+                cached_results = {
+                    doc.filename: result
+                    for doc, result in zip(documents, classified)
+                    if result is not None
+                }
+            pending_docs = [
+                doc for doc in documents if doc.filename not in cached_results
+            ]
+            if cached_results:
+                logger.info(f"{len(cached_results)} result(s) served from cache")
+
         # Analyze documents
         logger.info("Starting analysis...")
-        results = analyze_documents(
+        analyzed = analyze_documents(
             client,
-            documents,
+            pending_docs,
             config,
             cache=cache,
-            show_progress=show_progress
+            show_progress=show_progress,
+            cache_dir=config.input_dir if cache is not None else None,
         )
+
+        # Merge pre-fetched cache hits back in, preserving input order
+        analyzed_iter = iter(analyzed)
+        results = [
+            cached_results[doc.filename]
+            if doc.filename in cached_results
+            else next(analyzed_iter)
+            for doc in documents
+        ]
         
         # Save cache
         if cache is not None:
@@ -4,6 +4,7 @@ Configuration module for Gemini PDF Analyzer.
 Handles loading configuration from environment variables and provides defaults.
 """
 
+import functools
 import os
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -11,6 +12,16 @@ from typing import Optional
 
 from dotenv import load_dotenv
 
+_dotenv_loaded = False
+
+
+def _ensure_dotenv() -> None:
+    """Load the .env file once per process."""
+    global _dotenv_loaded
+    if not _dotenv_loaded:
+        load_dotenv()
+        _dotenv_loaded = True
+
 
 @dataclass
 class AppConfig:
@@ -21,7 +32,12 @@ class AppConfig:
     output_dir: Path
     model_name: str = "gemini-2.0-flash"
     max_chars_per_doc: int = 15000
+    max_input_tokens: Optional[int] = None
     max_docs: Optional[int] = None
+    max_concurrency: int = 4
+    requests_per_minute: int = 60
+    batch_size: int = 1
+    keep_raw_response: bool = False
     
     def __post_init__(self) -> None:
         """Ensure paths are Path objects."""
@@ -31,22 +47,30 @@ class AppConfig:
             self.output_dir = Path(self.output_dir)
 
 
+@functools.lru_cache(maxsize=8)
 def load_config(
     input_dir: Optional[str] = None,
     output_dir: Optional[str] = None,
     model_name: Optional[str] = None,
     max_docs: Optional[int] = None,
+    max_concurrency: Optional[int] = None,
+    batch_size: Optional[int] = None,
 ) -> AppConfig:
     """
     Load configuration from environment variables and CLI overrides.
-    
-    CLI arguments take precedence over environment variables.
-    
+
+    CLI arguments take precedence over environment variables. Results are
+    memoized per argument tuple, and the .env file is only read the first
+    time, so library imports that call this repeatedly pay nothing.
+
+
     Args:
         input_dir: Override for input directory path
         output_dir: Override for output directory path
         model_name: Override for Gemini model name
         max_docs: Maximum number of documents to process
+        max_concurrency: Maximum number of concurrent Gemini requests
+        batch_size: Number of short documents to pack into one prompt
         
     Returns:
         AppConfig instance with all settings
@@ -54,9 +78,9 @@ def load_config(
     Raises:
         ValueError: If GEMINI_API_KEY is not set
     """
-    # Load .env file if present
-    load_dotenv()
-    
+    # Load .env file if present (once per process)
+    _ensure_dotenv()
+
     # Get API key (required)
     api_key = os.getenv("GEMINI_API_KEY")
     if not api_key:
@@ -70,12 +94,23 @@ def load_config(
     default_output = os.getenv("OUTPUT_DIR", "data/output")
     default_model = os.getenv("MODEL_NAME", "gemini-2.0-flash")
     default_max_chars = int(os.getenv("MAX_CHARS_PER_DOC", "15000"))
-    
+    max_input_tokens_env = os.getenv("MAX_INPUT_TOKENS")
+    default_max_tokens = int(max_input_tokens_env) if max_input_tokens_env else None
+    default_concurrency = int(os.getenv("MAX_CONCURRENCY", "4"))
+    default_rpm = int(os.getenv("REQUESTS_PER_MINUTE", "60"))
+    default_batch_size = int(os.getenv("BATCH_SIZE", "1"))
+    default_keep_raw = os.getenv("KEEP_RAW_RESPONSE", "").lower() in ("1", "true", "yes")
+
     return AppConfig(
         gemini_api_key=api_key,
         input_dir=Path(input_dir) if input_dir else Path(default_input),
         output_dir=Path(output_dir) if output_dir else Path(default_output),
         model_name=model_name or default_model,
         max_chars_per_doc=default_max_chars,
+        max_input_tokens=default_max_tokens,
         max_docs=max_docs,
+        max_concurrency=max_concurrency or default_concurrency,
+        requests_per_minute=default_rpm,
+        batch_size=batch_size or default_batch_size,
+        keep_raw_response=default_keep_raw,
     )
@@ -4,18 +4,55 @@ Export module for Gemini PDF Analyzer.
 Handles exporting analysis results to CSV, JSON, and Excel formats.
 """
 
+import csv
 import json
 import logging
 from datetime import datetime
 from pathlib import Path
 from typing import List
 
+import openpyxl
 import pandas as pd
+from openpyxl.utils import get_column_letter
 
-from .models import PdfAnalysisResult
+from .models import PdfAnalysisResult, ResultBatch
+
+# orjson is an optional dependency; fall back to stdlib json when missing
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+# pyarrow serializes CSV in native code and provides the Feather/Arrow
+# IPC format; optional, stdlib csv is the fallback
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+    from pyarrow import feather as pa_feather
+except ImportError:
+    pa = None
+    pa_csv = None
+    pa_feather = None
 
 logger = logging.getLogger(__name__)
 
+# Export column order, shared by all writers
+FIELDNAMES = ("filename", "summary", "key_entities", "action_items", "keywords", "error")
+
+# Rows sampled when estimating Excel column widths
+WIDTH_SAMPLE_ROWS = 200
+
+# Cap column width for readability
+MAX_COLUMN_WIDTH = 50
+
+# Below this row count the stdlib csv writer is as fast as pyarrow
+ARROW_CSV_THRESHOLD = 1000
+
+# Precomputed line skeleton for the stdlib JSONL fallback: the schema is
+# fixed, so each line is the template plus json.dumps per value — no
+# per-record dict encoding
+_JSONL_TEMPLATE = "{{" + ",".join(f'"{name}":{{}}' for name in FIELDNAMES) + "}}\n"
+
 
 def _ensure_output_dir(output_dir: Path) -> None:
     """Create output directory if it doesn't exist."""
@@ -28,15 +65,94 @@ def _generate_filename(prefix: str, extension: str) -> str:
     return f"{prefix}_{timestamp}.{extension}"
 
 
-def _results_to_dataframe(results: List[PdfAnalysisResult]) -> pd.DataFrame:
-    """Convert results to a pandas DataFrame with proper column ordering."""
-    data = [result.to_dict() for result in results]
-    df = pd.DataFrame(data)
-    
-    # Reorder columns for readability
-    column_order = ["filename", "summary", "key_entities", "action_items", "keywords", "error"]
-    columns = [col for col in column_order if col in df.columns]
-    return df[columns]
+def _results_to_records(results: List[PdfAnalysisResult]) -> List[dict]:
+    """Convert results to export record dictionaries."""
+    return [result.to_dict() for result in results]
+
+
+def _records_to_dataframe(records: List[dict]) -> pd.DataFrame:
+    """Convert export records to a pandas DataFrame with proper column ordering."""
+    # An explicit column list skips pandas' per-record key inference and
+    # makes the reorder-after-the-fact pass unnecessary
+    return pd.DataFrame.from_records(records, columns=list(FIELDNAMES))
+
+
+def _results_to_arrow_table(results) -> "pa.Table":
+    """
+    Build a column-oriented Arrow table of string columns.
+
+    Accepts either a list of PdfAnalysisResult (gathered into a columnar
+    ResultBatch first) or an already-built ResultBatch, which converts
+    without transposing.
+    """
+    if not isinstance(results, ResultBatch):
+        results = ResultBatch.from_results(results)
+    return results.to_arrow()
+
+
+def _write_csv(results: List[PdfAnalysisResult], output_path: Path) -> None:
+    """Stream results to a CSV file as plain tuples, skipping dict construction."""
+    if pa is not None and len(results) >= ARROW_CSV_THRESHOLD:
+        # Large exports: pyarrow serializes columns in C with big buffered
+        # writes, well ahead of per-row Python formatting
+        pa_csv.write_csv(_results_to_arrow_table(results), output_path)
+    else:
+        # 1 MiB buffer batches the per-row writes into few syscalls
+        with open(output_path, "w", buffering=1 << 20, newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(FIELDNAMES)
+            writer.writerows(PdfAnalysisResult.to_rows(results))
+
+    logger.info(f"Exported {len(results)} results to CSV: {output_path}")
+
+
+def _write_json(records: List[dict], output_path: Path, jsonl: bool) -> None:
+    """Write export records as JSON Lines or a JSON array."""
+    if orjson is not None:
+        # orjson serializes in native code and returns bytes; joining the
+        # lines into one payload means a single write syscall
+        if jsonl:
+            payload = b"\n".join(orjson.dumps(item) for item in records)
+            if records:
+                payload += b"\n"
+        else:
+            payload = orjson.dumps(records, option=orjson.OPT_INDENT_2)
+        output_path.write_bytes(payload)
+    else:
+        with open(output_path, "w", buffering=1 << 20, encoding="utf-8") as f:
+            if jsonl:
+                for item in records:
+                    f.write(_JSONL_TEMPLATE.format(
+                        *(json.dumps(item[name], ensure_ascii=False) for name in FIELDNAMES)
+                    ))
+            else:
+                json.dump(records, f, ensure_ascii=False, indent=2)
+
+    logger.info(f"Exported {len(records)} results to JSON: {output_path}")
+
+
+def _write_excel(df: pd.DataFrame, output_path: Path) -> None:
+    """Stream a DataFrame to an Excel file via a write-only workbook."""
+    workbook = openpyxl.Workbook(write_only=True)
+    worksheet = workbook.create_sheet("Analysis Results")
+
+    # Column widths must be set before rows are appended in write-only mode
+    sample = df.head(WIDTH_SAMPLE_ROWS)
+    for idx, col in enumerate(df.columns, start=1):
+        max_length = max(
+            [len(str(value)) for value in sample[col]] + [len(col)]
+        )
+        worksheet.column_dimensions[get_column_letter(idx)].width = min(
+            max_length + 2, MAX_COLUMN_WIDTH
+        )
+
+    worksheet.append(list(df.columns))
+    for row in df.itertuples(index=False, name=None):
+        worksheet.append(row)
+
+    workbook.save(output_path)
+
+    logger.info(f"Exported {len(df)} results to Excel: {output_path}")
 
 
 def export_to_csv(
@@ -46,26 +162,26 @@ def export_to_csv(
 ) -> Path:
     """
     Export analysis results to a CSV file.
-    
+
+    Rows are streamed through the stdlib csv writer directly from the
+    results, so no intermediate DataFrame is materialized.
+
     Args:
         results: List of analysis results to export
         output_dir: Directory to save the CSV file
         filename: Optional custom filename (auto-generated if not provided)
-        
+
     Returns:
         Path to the created CSV file
     """
     _ensure_output_dir(output_dir)
-    
+
     if not filename:
         filename = _generate_filename("analysis_results", "csv")
-    
+
     output_path = output_dir / filename
-    df = _results_to_dataframe(results)
-    
-    df.to_csv(output_path, index=False, encoding="utf-8")
-    logger.info(f"Exported {len(results)} results to CSV: {output_path}")
-    
+    _write_csv(results, output_path)
+
     return output_path
 
 
@@ -76,40 +192,27 @@ def export_to_excel(
 ) -> Path:
     """
     Export analysis results to an Excel file (.xlsx).
-    
+
+    Uses openpyxl's write-only mode, which streams rows without building
+    the in-memory cell tree. Column widths are estimated from a bounded
+    sample of rows rather than scanning every cell.
+
     Args:
         results: List of analysis results to export
         output_dir: Directory to save the Excel file
         filename: Optional custom filename (auto-generated if not provided)
-        
+
     Returns:
         Path to the created Excel file
     """
     _ensure_output_dir(output_dir)
-    
+
     if not filename:
         filename = _generate_filename("analysis_results", "xlsx")
-    
+
     output_path = output_dir / filename
-    df = _results_to_dataframe(results)
-    
-    # Write to Excel with formatting
-    with pd.ExcelWriter(output_path, engine="openpyxl") as writer:
-        df.to_excel(writer, index=False, sheet_name="Analysis Results")
-        
-        # Auto-adjust column widths
-        worksheet = writer.sheets["Analysis Results"]
-        for idx, col in enumerate(df.columns):
-            max_length = max(
-                df[col].astype(str).map(len).max(),
-                len(col)
-            )
-            # Cap at 50 chars for readability
-            adjusted_width = min(max_length + 2, 50)
-            worksheet.column_dimensions[chr(65 + idx)].width = adjusted_width
-    
-    logger.info(f"Exported {len(results)} results to Excel: {output_path}")
-    
+    _write_excel(_records_to_dataframe(_results_to_records(results)), output_path)
+
     return output_path
 
 
@@ -121,36 +224,25 @@ def export_to_json(
 ) -> Path:
     """
     Export analysis results to JSON format.
-    
+
     Args:
         results: List of analysis results to export
         output_dir: Directory to save the JSON file
         filename: Optional custom filename (auto-generated if not provided)
         jsonl: If True, export as JSON Lines (one JSON object per line)
-        
+
     Returns:
         Path to the created JSON file
     """
     _ensure_output_dir(output_dir)
-    
+
     extension = "jsonl" if jsonl else "json"
     if not filename:
         filename = _generate_filename("analysis_results", extension)
-    
+
     output_path = output_dir / filename
-    
-    # Convert to dictionaries
-    data = [result.to_dict() for result in results]
-    
-    with open(output_path, "w", encoding="utf-8") as f:
-        if jsonl:
-            for item in data:
-                f.write(json.dumps(item, ensure_ascii=False) + "\n")
-        else:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-    
-    logger.info(f"Exported {len(results)} results to JSON: {output_path}")
-    
+    _write_json(_results_to_records(results), output_path, jsonl)
+
     return output_path
 
 
@@ -161,31 +253,63 @@ def export_results(
 ) -> dict[str, Path]:
     """
     Export results to multiple formats.
-    
+
+    The record dictionaries (and the DataFrame for the Excel writer) are
+    built once and shared across all requested formats.
+
     Args:
         results: List of analysis results to export
         output_dir: Directory to save output files
-        formats: List of formats to export ("csv", "json", "jsonl", "excel")
-                 Defaults to ["csv", "jsonl"]
-                 
+        formats: List of formats to export ("csv", "json", "jsonl",
+                 "excel", "arrow"). Defaults to ["csv", "jsonl"].
+                 "arrow" writes zstd-compressed Feather and requires
+                 pyarrow.
+
     Returns:
         Dictionary mapping format names to output file paths
     """
     if formats is None:
         formats = ["csv", "jsonl"]
-    
+
+    _ensure_output_dir(output_dir)
+    records = _results_to_records(results)
+
+    # One timestamp for the whole run, so all formats share a matching
+    # filename instead of each call re-reading the clock
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
     output_files = {}
-    
+
     for fmt in formats:
         if fmt == "csv":
-            output_files["csv"] = export_to_csv(results, output_dir)
+            path = output_dir / f"analysis_results_{timestamp}.csv"
+            _write_csv(results, path)
+            output_files["csv"] = path
         elif fmt == "json":
-            output_files["json"] = export_to_json(results, output_dir, jsonl=False)
+            path = output_dir / f"analysis_results_{timestamp}.json"
+            _write_json(records, path, jsonl=False)
+            output_files["json"] = path
         elif fmt == "jsonl":
-            output_files["jsonl"] = export_to_json(results, output_dir, jsonl=True)
+            path = output_dir / f"analysis_results_{timestamp}.jsonl"
+            _write_json(records, path, jsonl=True)
+            output_files["jsonl"] = path
         elif fmt == "excel":
-            output_files["excel"] = export_to_excel(results, output_dir)
+            path = output_dir / f"analysis_results_{timestamp}.xlsx"
+            _write_excel(_records_to_dataframe(records), path)
+            output_files["excel"] = path
+        elif fmt == "arrow":
+            if pa_feather is None:
+                logger.warning("Arrow export requires pyarrow; skipping")
+                continue
+            path = output_dir / f"analysis_results_{timestamp}.arrow"
+            # Columnar, zstd-compressed, and zero-copy to reload — far
+            # faster than CSV for downstream analytics
+            pa_feather.write_feather(
+                _results_to_arrow_table(results), path, compression="zstd"
+            )
+            logger.info(f"Exported {len(results)} results to Arrow: {path}")
+            output_files["arrow"] = path
         else:
             logger.warning(f"Unknown export format: {fmt}")
-    
+
     return output_files
@@ -6,10 +6,10 @@ Defines dataclasses for PDF documents and analysis results.
 
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class PdfDocument:
     """Represents a loaded PDF document with extracted text."""
     
@@ -24,7 +24,7 @@ class PdfDocument:
         return len(self.text)
 
 
-@dataclass  
+@dataclass(slots=True)
 class PdfAnalysisResult:
     """Result of Gemini analysis for a single PDF document."""
     
@@ -33,7 +33,7 @@ class PdfAnalysisResult:
     key_entities: str
     action_items: str
     keywords: List[str] = field(default_factory=list)
-    raw_response: str = ""
+    raw_response: str = field(default="", repr=False)
     error: Optional[str] = None
     
     @property
@@ -41,6 +41,31 @@ class PdfAnalysisResult:
         """Check if analysis was successful."""
         return self.error is None
     
+    def compact(self) -> None:
+        """
+        Drop the raw Gemini response to shrink the in-memory footprint.
+
+        Called once the raw text has been cached; exports never emit it.
+        """
+        self.raw_response = ""
+
+    @staticmethod
+    def to_rows(results: List["PdfAnalysisResult"]) -> Iterator[tuple]:
+        """
+        Yield export rows as tuples, in to_dict column order.
+
+        Lets writers stream rows without building a dict per result.
+        """
+        for r in results:
+            yield (
+                r.filename,
+                r.summary,
+                r.key_entities,
+                r.action_items,
+                ", ".join(r.keywords) if r.keywords else "",
+                r.error or "",
+            )
+
     def to_dict(self) -> dict:
         """Convert to dictionary for export."""
         return {
@@ -51,3 +76,60 @@ class PdfAnalysisResult:
             "keywords": ", ".join(self.keywords) if self.keywords else "",
             "error": self.error or "",
         }
+
+
+class ResultBatch:
+    """
+    Column-oriented (structure-of-arrays) container for analysis results.
+
+    Holds one list per export column instead of a list of dataclass
+    objects, so bulk consumers iterate plain lists rather than doing
+    per-object attribute lookups, and columns can be handed to Arrow
+    without transposing.
+    """
+
+    __slots__ = ("filenames", "summaries", "key_entities", "action_items",
+                 "keywords", "errors")
+
+    def __init__(self) -> None:
+        self.filenames: List[str] = []
+        self.summaries: List[str] = []
+        self.key_entities: List[str] = []
+        self.action_items: List[str] = []
+        self.keywords: List[str] = []
+        self.errors: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self.filenames)
+
+    def append(self, result: PdfAnalysisResult) -> None:
+        """Append one result's fields to the columns."""
+        self.filenames.append(result.filename)
+        self.summaries.append(result.summary)
+        self.key_entities.append(result.key_entities)
+        self.action_items.append(result.action_items)
+        self.keywords.append(", ".join(result.keywords) if result.keywords else "")
+        self.errors.append(result.error or "")
+
+    @classmethod
+    def from_results(cls, results: List[PdfAnalysisResult]) -> "ResultBatch":
+        """Build a batch from a list of results."""
+        batch = cls()
+        for result in results:
+            batch.append(result)
+        return batch
+
+    def columns(self) -> List[List[str]]:
+        """Return the columns in to_dict/to_rows order."""
+        return [self.filenames, self.summaries, self.key_entities,
+                self.action_items, self.keywords, self.errors]
+
+    def to_arrow(self):
+        """Convert to a pyarrow Table of string columns (requires pyarrow)."""
+        import pyarrow as pa
+
+        return pa.table(
+            [pa.array(col, type=pa.string()) for col in self.columns()],
+            names=["filename", "summary", "key_entities",
+                   "action_items", "keywords", "error"],
+        )
@@ -4,16 +4,36 @@ PDF loader module for Gemini PDF Analyzer.
 Handles scanning directories for PDFs and extracting text using pypdf.
 """
 
+import asyncio
 import fnmatch
+import functools
+import json
 import logging
+import mmap
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from pypdf import PdfReader
 from tqdm import tqdm
 
 from .models import PdfDocument
 
+# pymupdf extracts text in MuPDF C code, commonly 10-20x faster than
+# pypdf's pure-Python parser; optional dependency, pypdf is the fallback
+try:
+    import fitz
+except ImportError:
+    fitz = None
+
+# pyarrow backs the optional Arrow-native extraction output
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -39,117 +59,325 @@ def list_pdf_files(
     
     if not input_dir.is_dir():
         raise ValueError(f"Input path is not a directory: {input_dir}")
-    
-    pdf_files = list(input_dir.glob("*.pdf"))
-    pdf_files.extend(input_dir.glob("*.PDF"))
-    
-    # Remove duplicates (case-insensitive systems might have both)
-    unique_files = list(set(pdf_files))
-    
-    # Apply filter pattern if provided
+
+    # Compile the filter once; fnmatch.fnmatch would re-translate the
+    # pattern for every file
+    pattern = None
     if filter_pattern:
-        filtered = [
-            f for f in unique_files 
-            if fnmatch.fnmatch(f.name.lower(), filter_pattern.lower())
-        ]
-        logger.info(f"Filter '{filter_pattern}' matched {len(filtered)} of {len(unique_files)} files")
-        unique_files = filtered
-    
-    unique_files.sort(key=lambda p: p.name.lower())
-    
-    logger.info(f"Found {len(unique_files)} PDF files in {input_dir}")
-    return unique_files
+        pattern = re.compile(fnmatch.translate(filter_pattern.lower()))
+
+    # A single scandir pass reads the directory once and filters by
+    # suffix without stat-ing or materializing Paths for non-PDFs
+    pdf_files = []
+    total = 0
+    with os.scandir(input_dir) as entries:
+        for entry in entries:
+            if not entry.name.lower().endswith(".pdf") or not entry.is_file():
+                continue
+            total += 1
+            if pattern is not None and not pattern.match(entry.name.lower()):
+                continue
+            pdf_files.append(Path(entry.path))
+
+    if pattern is not None:
+        logger.info(f"Filter '{filter_pattern}' matched {len(pdf_files)} of {total} files")
+
+    pdf_files.sort(key=lambda p: p.name.lower())
+
+    logger.info(f"Found {len(pdf_files)} PDF files in {input_dir}")
+    return pdf_files
+
+
+def _extract_pages_fitz(path: Path) -> tuple[List[str], int]:
+    """Extract per-page text using pymupdf (MuPDF C extension)."""
+    doc = fitz.open(path)
+    try:
+        page_count = doc.page_count
+        text_parts = [""] * page_count
+        for i in range(page_count):
+            try:
+                text_parts[i] = doc.load_page(i).get_text("text") or ""
+            except Exception as e:
+                logger.warning(f"Failed to extract text from page {i+1} of {path.name}: {e}")
+    finally:
+        doc.close()
+
+    return text_parts, page_count
+
+
+def _extract_pages_pypdf_path(path: Path) -> tuple[List[str], int]:
+    """Extract per-page text using pypdf (pure Python)."""
+    # Memory-map the file when possible: pypdf then random-accesses the
+    # OS page cache instead of a userspace copy of the whole file. Empty
+    # files can't be mapped and some paths can't be opened directly —
+    # those fall back to handing pypdf the path
+    # strict=False skips pypdf's spec-compliance validation pass; page
+    # errors are already trapped per page below
+    try:
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # pypdf's annotation wants IO, but it only needs read/seek,
+            # which mmap provides
+            return _extract_pages_pypdf(
+                PdfReader(mm, strict=False), path  # type: ignore[arg-type]
+            )
+    except (OSError, ValueError):
+        return _extract_pages_pypdf(PdfReader(path, strict=False), path)
+
+
+def _extract_pages_pypdf(reader: PdfReader, path: Path) -> tuple[List[str], int]:
+    """Run the per-page extraction loop over an open pypdf reader."""
+    # Access the pages collection once; repeated reader.pages lookups can
+    # rescan the /Pages tree in pypdf
+    pages = reader.pages
+    page_count = len(pages)
+
+    text_parts = [""] * page_count
+    for i in range(page_count):
+        page = pages[i]
+        try:
+            text_parts[i] = page.extract_text() or ""
+        except Exception as e:
+            logger.warning(f"Failed to extract text from page {i+1} of {path.name}: {e}")
+        finally:
+            # Drop our reference so extracted page objects can be freed as
+            # the loop advances instead of all living until the join
+            del page
+
+    # Release pypdf's parsed page tree before returning; only the text matters
+    reader.flattened_pages = None
+
+    return text_parts, page_count
+
+
+def _extract_pages(path: Path) -> tuple[List[str], int]:
+    """Extract per-page text from a PDF, dispatching to the best backend."""
+    if fitz is not None:
+        return _extract_pages_fitz(path)
+    return _extract_pages_pypdf_path(path)
 
 
 def extract_text(path: Path) -> tuple[str, int]:
     """
     Extract text content from a PDF file.
-    
+
+    Uses pymupdf when installed; otherwise falls back to pypdf.
+
     Args:
         path: Path to the PDF file
-        
+
     Returns:
         Tuple of (extracted text, page count)
-        
+
     Raises:
         Exception: If PDF cannot be read or parsed
     """
     logger.debug(f"Extracting text from: {path.name}")
-    
-    reader = PdfReader(path)
-    page_count = len(reader.pages)
-    
-    text_parts = []
-    for i, page in enumerate(reader.pages):
-        try:
-            page_text = page.extract_text() or ""
-            text_parts.append(page_text)
-        except Exception as e:
-            logger.warning(f"Failed to extract text from page {i+1} of {path.name}: {e}")
-            text_parts.append("")
-    
+
+    text_parts, page_count = _extract_pages(path)
     full_text = "\n\n".join(text_parts)
+
     logger.debug(f"Extracted {len(full_text)} characters from {page_count} pages")
-    
+
     return full_text, page_count
 
 
+def extract_text_arrow(path: Path) -> "pa.LargeStringArray":
+    """
+    Extract text as an Arrow large_string array of per-page values.
+
+    Skips the final join into one Python string, so Arrow-based
+    consumers can slice pages or hand the array to columnar writers
+    without another copy. Requires pyarrow.
+
+    Args:
+        path: Path to the PDF file
+
+    Returns:
+        pyarrow large_string array with one value per page
+    """
+    if pa is None:
+        raise ImportError("extract_text_arrow requires pyarrow")
+
+    text_parts, _ = _extract_pages(path)
+    return pa.array(text_parts, type=pa.large_string())
+
+
+def _extract_one(
+    path: Path,
+    text_cache_dir: Optional[Path] = None,
+) -> Tuple[Path, str, int, Optional[str]]:
+    """
+    Extract a single PDF, trapping failures.
+
+    Returns a (path, text, page_count, error) tuple; failed extractions
+    yield empty text and the error message. Picklable so it can run in
+    worker processes.
+
+    When `text_cache_dir` is given, extracted text is cached on disk keyed
+    by the PDF's content hash, so unchanged files skip parsing entirely on
+    later runs.
+    """
+    try:
+        cache_path = None
+        if text_cache_dir is not None:
+            # Deferred import: cache pulls in optional hashing dependencies
+            from .cache import _compute_file_hash
+
+            cache_path = text_cache_dir / f"{_compute_file_hash(path)}.json"
+            if cache_path.exists():
+                try:
+                    data = json.loads(cache_path.read_text(encoding="utf-8"))
+                    return (path, data["text"], data["page_count"], None)
+                except Exception as e:
+                    logger.debug(f"Ignoring unreadable text cache for {path.name}: {e}")
+
+        text, page_count = extract_text(path)
+
+        if cache_path is not None:
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                cache_path.write_text(
+                    json.dumps({"text": text, "page_count": page_count}, ensure_ascii=False),
+                    encoding="utf-8",
+                )
+            except Exception as e:
+                logger.debug(f"Failed to write text cache for {path.name}: {e}")
+
+        return (path, text, page_count, None)
+    except Exception as e:
+        return (path, "", 0, str(e))
+
+
 def load_pdfs(
     input_dir: Path,
     max_docs: Optional[int] = None,
     filter_pattern: Optional[str] = None,
-    show_progress: bool = True
+    show_progress: bool = True,
+    max_workers: Optional[int] = None,
+    use_processes: bool = False,
+    text_cache_dir: Optional[Path] = None,
 ) -> List[PdfDocument]:
     """
     Load all PDF files from a directory.
-    
+
+    Extraction runs in a thread pool by default: pypdf releases the GIL
+    during file I/O and decompression, so threads overlap disk reads with
+    parsing. Pass `use_processes=True` to move fully CPU-bound parsing
+    onto worker processes instead, or `max_workers=1` for a sequential
+    loop.
+
     Args:
         input_dir: Directory containing PDF files
         max_docs: Maximum number of documents to load (None for all)
         filter_pattern: Optional glob/fnmatch pattern to filter filenames
         show_progress: Whether to show a progress bar
-        
+        max_workers: Number of extraction workers (defaults to CPU count);
+            1 disables parallelism
+        use_processes: Extract in worker processes instead of threads
+        text_cache_dir: Optional directory for a content-addressed cache of
+            extracted text, letting unchanged files skip parsing on re-runs
+
     Returns:
-        List of PdfDocument objects with extracted text
+        List of PdfDocument objects with extracted text, in directory order
     """
     pdf_files = list_pdf_files(input_dir, filter_pattern)
-    
+
     if max_docs is not None:
         pdf_files = pdf_files[:max_docs]
         logger.info(f"Limited to {max_docs} documents")
-    
+
+    extract_one = functools.partial(_extract_one, text_cache_dir=text_cache_dir)
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 4
+
+    if max_workers > 1:
+        executor_cls = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+        map_kwargs = {"chunksize": 4} if use_processes else {}
+        with executor_cls(max_workers=max_workers) as executor:
+            # executor.map preserves input order
+            extracted = list(tqdm(
+                executor.map(extract_one, pdf_files, **map_kwargs),
+                total=len(pdf_files),
+                desc="Loading PDFs",
+                unit="file",
+                disable=not show_progress,
+            ))
+    else:
+        iterator = tqdm(
+            pdf_files,
+            desc="Loading PDFs",
+            unit="file",
+            disable=not show_progress
+        )
+        extracted = []
+        for pdf_path in iterator:
+            iterator.set_postfix_str(pdf_path.name[:30])
+            extracted.append(extract_one(pdf_path))
+
+    return _build_documents(extracted)
+
+
+def _build_documents(
+    extracted: List[Tuple[Path, str, int, Optional[str]]],
+) -> List[PdfDocument]:
+    """Turn (path, text, page_count, error) tuples into PdfDocument objects."""
     documents = []
-    
-    # Create progress bar iterator
-    iterator = tqdm(
-        pdf_files,
-        desc="Loading PDFs",
-        unit="file",
-        disable=not show_progress
-    )
-    
-    for pdf_path in iterator:
-        iterator.set_postfix_str(pdf_path.name[:30])
-        try:
-            text, page_count = extract_text(pdf_path)
-            doc = PdfDocument(
-                path=pdf_path,
-                filename=pdf_path.name,
-                text=text,
-                page_count=page_count,
-            )
-            documents.append(doc)
-            logger.debug(f"Loaded: {pdf_path.name} ({page_count} pages, {len(text)} chars)")
-        except Exception as e:
-            logger.error(f"Failed to load {pdf_path.name}: {e}")
-            # Create a document entry with error info
-            doc = PdfDocument(
-                path=pdf_path,
-                filename=pdf_path.name,
-                text="",
-                page_count=0,
-            )
-            documents.append(doc)
-    
+    for path, text, page_count, error in extracted:
+        if error is not None:
+            logger.error(f"Failed to load {path.name}: {error}")
+        else:
+            logger.debug(f"Loaded: {path.name} ({page_count} pages, {len(text)} chars)")
+        documents.append(PdfDocument(
+            path=path,
+            filename=path.name,
+            text=text,
+            page_count=page_count,
+        ))
+
     logger.info(f"Successfully loaded {len(documents)} documents")
     return documents
+
+
+async def load_pdfs_async(
+    input_dir: Path,
+    max_docs: Optional[int] = None,
+    filter_pattern: Optional[str] = None,
+    max_workers: Optional[int] = None,
+    text_cache_dir: Optional[Path] = None,
+) -> List[PdfDocument]:
+    """
+    Async variant of load_pdfs.
+
+    Extractions run concurrently in worker threads via asyncio.to_thread,
+    so disk reads overlap with parsing and the event loop stays free for
+    callers that interleave loading with other async work (e.g. warming
+    the analysis pipeline).
+
+    Args:
+        input_dir: Directory containing PDF files
+        max_docs: Maximum number of documents to load (None for all)
+        filter_pattern: Optional glob/fnmatch pattern to filter filenames
+        max_workers: Maximum concurrent extractions (defaults to CPU count)
+        text_cache_dir: Optional directory for a content-addressed cache of
+            extracted text
+
+    Returns:
+        List of PdfDocument objects with extracted text, in directory order
+    """
+    pdf_files = list_pdf_files(input_dir, filter_pattern)
+
+    if max_docs is not None:
+        pdf_files = pdf_files[:max_docs]
+        logger.info(f"Limited to {max_docs} documents")
+
+    extract_one = functools.partial(_extract_one, text_cache_dir=text_cache_dir)
+    semaphore = asyncio.Semaphore(max_workers or os.cpu_count() or 4)
+
+    async def extract(path: Path) -> Tuple[Path, str, int, Optional[str]]:
+        async with semaphore:
+            return await asyncio.to_thread(extract_one, path)
+
+    extracted = await asyncio.gather(*(extract(path) for path in pdf_files))
+
+    return _build_documents(extracted)
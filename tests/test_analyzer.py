@@ -1,17 +1,24 @@
 """Tests for the analyzer module."""
 
+import asyncio
+import json
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from gemini_pdf_analyzer.analyzer import (
+    TokenBucket,
+    _group_into_batches,
     _parse_response,
+    analyze_batch,
     analyze_document,
+    analyze_documents,
+    analyze_documents_async,
     create_client,
 )
 from gemini_pdf_analyzer.config import AppConfig
-from gemini_pdf_analyzer.models import PdfDocument
+from gemini_pdf_analyzer.models import PdfAnalysisResult, PdfDocument
 
 
 class TestParseResponse:
@@ -55,6 +62,261 @@ Just a summary, nothing else."""
         # Should have some default handling
 
 
+class FakeClock:
+    """Deterministic stand-in for time.monotonic/time.sleep."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.slept = 0.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+        self.slept += seconds
+
+
+class TestTokenBucket:
+    """Tests for the AIMD token-bucket rate limiter."""
+
+    @pytest.fixture
+    def clock(self) -> FakeClock:
+        """Patch the analyzer's clock so token refill is deterministic."""
+        fake = FakeClock()
+        with patch("gemini_pdf_analyzer.analyzer.time.monotonic", fake.monotonic), \
+                patch("gemini_pdf_analyzer.analyzer.time.sleep", fake.sleep):
+            yield fake
+
+    def test_acquire_blocks_until_refill(self, clock: FakeClock) -> None:
+        """An empty bucket waits exactly one token's worth of refill time."""
+        bucket = TokenBucket(requests_per_minute=60)  # 1 token/s, capacity 1
+
+        bucket.acquire()  # consumes the initial token immediately
+        assert clock.slept == 0.0
+
+        bucket.acquire()  # bucket empty: must wait ~1s of (fake) refill
+        assert clock.slept == pytest.approx(1.0)
+
+    def test_refill_caps_at_capacity(self, clock: FakeClock) -> None:
+        """Idle time never banks more than the bucket's capacity."""
+        bucket = TokenBucket(requests_per_minute=60)
+
+        clock.now += 100.0  # long idle period
+        bucket.acquire()  # one banked token, consumed without sleeping
+        assert clock.slept == 0.0
+
+        bucket.acquire()  # capacity is 1, so the idle time banked nothing more
+        assert clock.slept == pytest.approx(1.0)
+
+    def test_multiplicative_decrease_floors_at_one_rpm(self, clock: FakeClock) -> None:
+        """Repeated rate-limit errors never push the rate below 1 rpm."""
+        bucket = TokenBucket(requests_per_minute=60)
+
+        for _ in range(20):
+            bucket.multiplicative_decrease()
+
+        assert bucket._rate == pytest.approx(1.0 / 60.0)
+
+    def test_additive_recovery_after_success_run(self, clock: FakeClock) -> None:
+        """SUCCESS_THRESHOLD consecutive successes raise the rate by 1 rpm."""
+        bucket = TokenBucket(requests_per_minute=60)
+        bucket.multiplicative_decrease()  # 60 rpm -> 30 rpm
+        reduced = bucket._rate
+
+        for _ in range(TokenBucket.SUCCESS_THRESHOLD - 1):
+            bucket.record_success()
+        assert bucket._rate == pytest.approx(reduced)
+
+        bucket.record_success()
+        assert bucket._rate == pytest.approx(reduced + 1.0 / 60.0)
+
+    def test_recovery_never_exceeds_target_rate(self, clock: FakeClock) -> None:
+        """Additive recovery is capped at the configured rate."""
+        bucket = TokenBucket(requests_per_minute=2)
+        bucket.multiplicative_decrease()
+
+        for _ in range(TokenBucket.SUCCESS_THRESHOLD * 100):
+            bucket.record_success()
+
+        assert bucket._rate == pytest.approx(2.0 / 60.0)
+
+
+class TestGroupIntoBatches:
+    """Tests for the greedy prompt-batch grouping."""
+
+    @staticmethod
+    def _pending(texts: list[str]) -> list[tuple]:
+        """Build (index, document) pairs from per-document texts."""
+        return [
+            (
+                i,
+                PdfDocument(
+                    path=Path(f"doc{i}.pdf"),
+                    filename=f"doc{i}.pdf",
+                    text=text,
+                    page_count=1,
+                ),
+            )
+            for i, text in enumerate(texts)
+        ]
+
+    @staticmethod
+    def _config(**overrides: object) -> AppConfig:
+        """Create a batching config with overridable limits."""
+        settings: dict = {
+            "gemini_api_key": "test-key",
+            "input_dir": Path("input"),
+            "output_dir": Path("output"),
+            "max_chars_per_doc": 1000,
+            "batch_size": 3,
+        }
+        settings.update(overrides)
+        return AppConfig(**settings)
+
+    def test_groups_up_to_batch_size(self) -> None:
+        """Short documents pack into batches of at most batch_size."""
+        batches = _group_into_batches(self._pending(["short text"] * 5), self._config())
+
+        assert [len(batch) for batch in batches] == [3, 2]
+        # Index/document pairs flow through unchanged, in input order
+        assert [i for batch in batches for i, _ in batch] == [0, 1, 2, 3, 4]
+
+    def test_oversized_doc_gets_own_batch(self) -> None:
+        """A document over the per-doc cap never shares a prompt."""
+        # Per-doc cap is 1000 // 3 = 333 characters
+        batches = _group_into_batches(
+            self._pending(["a" * 10, "b" * 400, "c" * 10]), self._config()
+        )
+
+        assert [[i for i, _ in batch] for batch in batches] == [[1], [0, 2]]
+
+    def test_token_budget_tightens_per_doc_cap(self) -> None:
+        """A configured token budget shrinks the per-doc cap like the single path."""
+        # 30 tokens * 4 chars/token = 120-char budget, so 40 chars per doc
+        batches = _group_into_batches(
+            self._pending(["a" * 60, "b" * 10]),
+            self._config(max_input_tokens=30),
+        )
+
+        assert [[i for i, _ in batch] for batch in batches] == [[0], [1]]
+
+
+class TestAnalyzeBatch:
+    """Tests for the batched-prompt request path."""
+
+    @pytest.fixture
+    def batch_config(self) -> AppConfig:
+        """Create a config with prompt batching enabled."""
+        return AppConfig(
+            gemini_api_key="test-key",
+            input_dir=Path("input"),
+            output_dir=Path("output"),
+            model_name="gemini-2.0-flash",
+            max_chars_per_doc=1000,
+            batch_size=3,
+            # Keep the rate limiter from throttling mocked calls
+            requests_per_minute=6000,
+        )
+
+    @staticmethod
+    def _make_docs(count: int) -> list[PdfDocument]:
+        """Create short documents doc0..docN-1."""
+        return [
+            PdfDocument(
+                path=Path(f"doc{i}.pdf"),
+                filename=f"doc{i}.pdf",
+                text=f"Document number {i} text.",
+                page_count=1,
+            )
+            for i in range(count)
+        ]
+
+    @staticmethod
+    def _batch_response(analyses: list[dict]) -> MagicMock:
+        """Build a mock response carrying a JSON batch analysis array."""
+        response = MagicMock()
+        response.text = json.dumps(analyses)
+        return response
+
+    def test_batch_results_dedup_keywords(
+        self,
+        batch_config: AppConfig,
+    ) -> None:
+        """Repeated keywords from the model are deduplicated in batch mode."""
+        docs = self._make_docs(2)
+        mock_client = MagicMock()
+        mock_client.models.generate_content.return_value = self._batch_response([
+            {"id": 0, "summary": "Summary zero", "key_entities": "",
+             "action_items": "", "keywords": ["alpha", "beta", "alpha", "beta"]},
+            {"id": 1, "summary": "Summary one", "key_entities": "",
+             "action_items": "", "keywords": ["gamma", "gamma"]},
+        ])
+
+        results = analyze_batch(mock_client, docs, batch_config)
+
+        assert results[0].keywords == ["alpha", "beta"]
+        assert results[1].keywords == ["gamma"]
+
+    def test_batch_maps_out_of_order_ids(
+        self,
+        batch_config: AppConfig,
+    ) -> None:
+        """Analyses are matched to documents by id, not response order."""
+        docs = self._make_docs(2)
+        mock_client = MagicMock()
+        mock_client.models.generate_content.return_value = self._batch_response([
+            {"id": 1, "summary": "Summary one", "key_entities": "",
+             "action_items": "", "keywords": []},
+            {"id": 0, "summary": "Summary zero", "key_entities": "",
+             "action_items": "", "keywords": []},
+        ])
+
+        results = analyze_batch(mock_client, docs, batch_config)
+
+        assert [r.filename for r in results] == ["doc0.pdf", "doc1.pdf"]
+        assert results[0].summary == "Summary zero"
+        assert results[1].summary == "Summary one"
+
+    @patch("gemini_pdf_analyzer.analyzer.time.sleep")
+    def test_incomplete_ids_fall_back_per_document(
+        self,
+        mock_sleep: MagicMock,
+        batch_config: AppConfig,
+    ) -> None:
+        """A response not covering every id retries, then falls back per doc."""
+        docs = self._make_docs(2)
+
+        def single_response(summary: str) -> MagicMock:
+            response = MagicMock()
+            response.text = json.dumps({
+                "summary": summary, "key_entities": "",
+                "action_items": "", "keywords": [],
+            })
+            return response
+
+        # Only id 0 comes back for a 2-document batch
+        incomplete = self._batch_response([
+            {"id": 0, "summary": "Only zero", "key_entities": "",
+             "action_items": "", "keywords": []},
+        ])
+        mock_client = MagicMock()
+        mock_client.models.generate_content.side_effect = [
+            incomplete, incomplete, incomplete,  # batch attempts, all rejected
+            single_response("Recovered zero"),
+            single_response("Recovered one"),
+        ]
+
+        results = analyze_batch(mock_client, docs, batch_config)
+
+        # 3 failed batch attempts plus one per-document fallback call each
+        assert mock_client.models.generate_content.call_count == 5
+        assert [r.filename for r in results] == ["doc0.pdf", "doc1.pdf"]
+        assert results[0].summary == "Recovered zero"
+        assert results[1].summary == "Recovered one"
+        assert all(r.is_successful for r in results)
+
+
 class TestCreateClient:
     """Tests for create_client function."""
     
@@ -63,10 +325,12 @@ class TestCreateClient:
         """Test successful client creation."""
         mock_client = MagicMock()
         mock_client_class.return_value = mock_client
-        
+
         result = create_client("test-api-key")
-        
-        mock_client_class.assert_called_once_with(api_key="test-api-key")
+
+        mock_client_class.assert_called_once()
+        assert mock_client_class.call_args.kwargs["api_key"] == "test-api-key"
+        assert mock_client_class.call_args.kwargs["http_options"] is not None
         assert result == mock_client
 
 
@@ -82,6 +346,8 @@ class TestAnalyzeDocument:
             output_dir=Path("output"),
             model_name="gemini-2.0-flash",
             max_chars_per_doc=1000,
+            # Keep the rate limiter from throttling mocked calls
+            requests_per_minute=6000,
         )
     
     @pytest.fixture
@@ -159,6 +425,198 @@ test, document"""
         assert result.error is not None
         assert "API Error" in result.error
     
+    def test_analyze_documents_preserves_input_order(
+        self,
+        sample_config: AppConfig,
+    ) -> None:
+        """Results must line up with input documents despite concurrency."""
+        docs = [
+            PdfDocument(
+                path=Path(f"doc{i}.pdf"),
+                filename=f"doc{i}.pdf",
+                text=f"Document number {i} text.",
+                page_count=1,
+            )
+            for i in range(5)
+        ]
+
+        def fake_generate(**kwargs: object) -> MagicMock:
+            # Echo the document number from the prompt back in the summary
+            prompt = str(kwargs["contents"])
+            number = prompt.split("Document number ")[1].split(" ")[0]
+            response = MagicMock()
+            response.text = f"SUMMARY:\nAbout document {number}."
+            return response
+
+        mock_client = MagicMock()
+        mock_client.models.generate_content.side_effect = fake_generate
+
+        results = analyze_documents(
+            mock_client, docs, sample_config, show_progress=False
+        )
+
+        assert len(results) == 5
+        for i, result in enumerate(results):
+            assert result.filename == f"doc{i}.pdf"
+            assert f"document {i}" in result.summary.lower()
+
+    def test_analyze_documents_mixes_cache_hits_and_misses(
+        self,
+        sample_config: AppConfig,
+    ) -> None:
+        """Cached documents skip the API; misses are analyzed and cached."""
+        docs = [
+            PdfDocument(
+                path=Path(f"doc{i}.pdf"),
+                filename=f"doc{i}.pdf",
+                text=f"Document number {i} text.",
+                page_count=1,
+            )
+            for i in range(3)
+        ]
+        cached = PdfAnalysisResult(
+            filename="doc1.pdf",
+            summary="Cached summary.",
+            key_entities="",
+            action_items="",
+        )
+
+        mock_response = MagicMock()
+        mock_response.text = "SUMMARY:\nFresh summary."
+        mock_client = MagicMock()
+        mock_client.models.generate_content.return_value = mock_response
+
+        with patch(
+            "gemini_pdf_analyzer.cache.get_cached_result",
+            side_effect=lambda cache, doc: cached if doc.filename == "doc1.pdf" else None,
+        ), patch("gemini_pdf_analyzer.cache.cache_result") as mock_cache_result:
+            results = analyze_documents(
+                mock_client, docs, sample_config, cache={}, show_progress=False
+            )
+
+        # Only the two misses hit the API and were written back to the cache
+        assert mock_client.models.generate_content.call_count == 2
+        assert mock_cache_result.call_count == 2
+
+        assert [r.filename for r in results] == ["doc0.pdf", "doc1.pdf", "doc2.pdf"]
+        assert results[1].summary == "Cached summary."
+        assert results[0].summary == "Fresh summary."
+        assert results[2].summary == "Fresh summary."
+
+    @patch("gemini_pdf_analyzer.analyzer.time.sleep")
+    def test_analyze_documents_reports_failures_in_place(
+        self,
+        mock_sleep: MagicMock,
+        sample_config: AppConfig,
+    ) -> None:
+        """A document whose analysis fails yields an error result at its index."""
+        docs = [
+            PdfDocument(
+                path=Path(f"doc{i}.pdf"),
+                filename=f"doc{i}.pdf",
+                text=f"Document number {i} text.",
+                page_count=1,
+            )
+            for i in range(2)
+        ]
+
+        def fake_generate(**kwargs: object) -> MagicMock:
+            if "number 0" in str(kwargs["contents"]):
+                raise Exception("API Error")
+            response = MagicMock()
+            response.text = "SUMMARY:\nFresh summary."
+            return response
+
+        mock_client = MagicMock()
+        mock_client.models.generate_content.side_effect = fake_generate
+
+        results = analyze_documents(
+            mock_client, docs, sample_config, show_progress=False
+        )
+
+        assert len(results) == 2
+        assert not results[0].is_successful
+        assert "API Error" in (results[0].error or "")
+        assert results[1].is_successful
+
+    def test_analyze_documents_async_preserves_input_order(
+        self,
+        sample_config: AppConfig,
+    ) -> None:
+        """The async entrypoint lines results up with input documents."""
+        docs = [
+            PdfDocument(
+                path=Path(f"doc{i}.pdf"),
+                filename=f"doc{i}.pdf",
+                text=f"Document number {i} text.",
+                page_count=1,
+            )
+            for i in range(3)
+        ]
+
+        def fake_generate(**kwargs: object) -> MagicMock:
+            # Echo the document number from the prompt back in the summary
+            prompt = str(kwargs["contents"])
+            number = prompt.split("Document number ")[1].split(" ")[0]
+            response = MagicMock()
+            response.text = f"SUMMARY:\nAbout document {number}."
+            return response
+
+        mock_client = MagicMock()
+        mock_client.aio.models.generate_content = AsyncMock(side_effect=fake_generate)
+
+        results = asyncio.run(
+            analyze_documents_async(mock_client, docs, sample_config)
+        )
+
+        assert len(results) == 3
+        for i, result in enumerate(results):
+            assert result.filename == f"doc{i}.pdf"
+            assert f"document {i}" in result.summary.lower()
+
+    def test_batch_mode_skips_empty_documents(
+        self,
+        sample_config: AppConfig,
+    ) -> None:
+        """Empty documents get their error result without joining a batch."""
+        sample_config.batch_size = 3
+        docs = [
+            PdfDocument(
+                path=Path(f"doc{i}.pdf"),
+                filename=f"doc{i}.pdf",
+                text=text,
+                page_count=1,
+            )
+            for i, text in enumerate(
+                ["Document number 0 text.", "   \n\t", "Document number 2 text."]
+            )
+        ]
+
+        mock_response = MagicMock()
+        mock_response.text = json.dumps([
+            {"id": 0, "summary": "Summary zero",
+             "key_entities": "", "action_items": "", "keywords": []},
+            {"id": 1, "summary": "Summary two",
+             "key_entities": "", "action_items": "", "keywords": []},
+        ])
+        mock_client = MagicMock()
+        mock_client.models.generate_content.return_value = mock_response
+
+        results = analyze_documents(
+            mock_client, docs, sample_config, show_progress=False
+        )
+
+        # One batched call covers the two non-empty documents; the
+        # whitespace-only one never reached the prompt
+        assert mock_client.models.generate_content.call_count == 1
+        prompt = mock_client.models.generate_content.call_args.kwargs["contents"]
+        assert "doc1.pdf" not in prompt
+
+        assert results[1].error == "Empty document"
+        assert "no extractable text" in results[1].summary.lower()
+        assert results[0].summary == "Summary zero"
+        assert results[2].summary == "Summary two"
+
     def test_analyze_document_truncates_long_text(
         self,
         sample_config: AppConfig,
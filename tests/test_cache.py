@@ -7,11 +7,16 @@ from unittest.mock import patch, MagicMock
 import pytest
 
 from gemini_pdf_analyzer.cache import (
+    CACHE_FILENAME,
+    HASH_ALGO,
+    LEGACY_CACHE_FILENAME,
+    append_cache_entry,
     load_cache,
     save_cache,
     get_cached_result,
     cache_result,
     clear_cache,
+    warm_cache,
     _compute_file_hash,
 )
 from gemini_pdf_analyzer.models import PdfDocument, PdfAnalysisResult
@@ -78,6 +83,63 @@ class TestLoadSaveCache:
         assert result is False
 
 
+class TestCacheLog:
+    """Tests for the append-only JSONL cache log format."""
+
+    def test_replay_keeps_last_entry_per_key(self, tmp_path: Path) -> None:
+        """Duplicate keys in the log must resolve to the newest entry."""
+        append_cache_entry(tmp_path, "test.pdf", {"summary": "first"})
+        append_cache_entry(tmp_path, "other.pdf", {"summary": "other"})
+        append_cache_entry(tmp_path, "test.pdf", {"summary": "second"})
+
+        loaded = load_cache(tmp_path)
+
+        assert loaded["test.pdf"] == {"summary": "second"}
+        assert loaded["other.pdf"] == {"summary": "other"}
+
+    def test_append_survives_without_save(self, tmp_path: Path) -> None:
+        """Appended entries are durable even if save_cache never runs."""
+        append_cache_entry(tmp_path, "test.pdf", {"summary": "crash-safe"})
+
+        loaded = load_cache(tmp_path)
+
+        assert loaded == {"test.pdf": {"summary": "crash-safe"}}
+
+    def test_save_compacts_duplicate_keys(self, tmp_path: Path) -> None:
+        """save_cache rewrites the log with one line per key."""
+        append_cache_entry(tmp_path, "test.pdf", {"summary": "first"})
+        append_cache_entry(tmp_path, "test.pdf", {"summary": "second"})
+
+        save_cache(tmp_path, load_cache(tmp_path))
+
+        log_lines = (tmp_path / CACHE_FILENAME).read_bytes().splitlines()
+        assert len(log_lines) == 1
+        assert load_cache(tmp_path) == {"test.pdf": {"summary": "second"}}
+
+    def test_legacy_json_cache_is_loaded_and_migrated(self, tmp_path: Path) -> None:
+        """A pre-JSONL cache file loads as-is and migrates on save."""
+        legacy = {"test.pdf": {"summary": "legacy entry"}}
+        (tmp_path / LEGACY_CACHE_FILENAME).write_text(
+            json.dumps(legacy), encoding="utf-8"
+        )
+
+        loaded = load_cache(tmp_path)
+        assert loaded == legacy
+
+        save_cache(tmp_path, loaded)
+        assert (tmp_path / CACHE_FILENAME).exists()
+        assert load_cache(tmp_path) == legacy
+
+    def test_jsonl_takes_precedence_over_legacy(self, tmp_path: Path) -> None:
+        """Once the JSONL log exists, the legacy file is ignored."""
+        (tmp_path / LEGACY_CACHE_FILENAME).write_text(
+            json.dumps({"test.pdf": {"summary": "stale"}}), encoding="utf-8"
+        )
+        append_cache_entry(tmp_path, "test.pdf", {"summary": "current"})
+
+        assert load_cache(tmp_path) == {"test.pdf": {"summary": "current"}}
+
+
 class TestCacheResult:
     """Tests for caching and retrieving results."""
     
@@ -139,6 +201,105 @@ class TestCacheResult:
     def test_cache_miss_not_cached(self, sample_doc: PdfDocument) -> None:
         """Test cache miss when file not in cache."""
         cache = {}
-        
+
         result = get_cached_result(cache, sample_doc)
         assert result is None
+
+
+class TestWarmCache:
+    """Tests for the warm_cache maintenance pass."""
+
+    @pytest.fixture
+    def sample_doc(self, tmp_path: Path) -> PdfDocument:
+        """Create a sample document with an actual file."""
+        pdf_path = tmp_path / "test.pdf"
+        pdf_path.write_bytes(b"fake pdf content")
+        return PdfDocument(
+            path=pdf_path,
+            filename="test.pdf",
+            text="Sample text",
+            page_count=1,
+        )
+
+    @staticmethod
+    def _legacy_entry(filename: str) -> dict:
+        """Build an intact cache entry hashed with a superseded algorithm."""
+        return {
+            "filename": filename,
+            "summary": "Legacy summary",
+            "key_entities": "Entity A",
+            "action_items": "Action 1",
+            "keywords": ["legacy"],
+            "error": None,
+            "file_hash": "0123456789abcdef",
+            "hash_algo": "md5",
+            "size": 1,
+            "mtime_ns": 1,
+        }
+
+    def test_prunes_entries_for_missing_files(
+        self, sample_doc: PdfDocument
+    ) -> None:
+        """Entries whose files are gone are removed and counted."""
+        cache = {
+            "gone.pdf": {"summary": "stale"},
+            "also_gone.pdf": {"summary": "stale"},
+        }
+
+        pruned = warm_cache(cache, [sample_doc])
+
+        assert pruned == 2
+        assert cache == {}
+
+    def test_present_filenames_protects_unverified_entries(
+        self, sample_doc: PdfDocument
+    ) -> None:
+        """A filtered warm pass must not prune entries for excluded files."""
+        cache = {
+            "other.pdf": {"summary": "still valid"},
+            "gone.pdf": {"summary": "stale"},
+        }
+
+        # other.pdf is on disk but excluded from verification (e.g. by
+        # --filter); only the genuinely missing file may be pruned
+        pruned = warm_cache(
+            cache,
+            [sample_doc],
+            present_filenames={sample_doc.filename, "other.pdf"},
+        )
+
+        assert pruned == 1
+        assert "other.pdf" in cache
+        assert "gone.pdf" not in cache
+
+    def test_upgrades_legacy_algorithm_entries(
+        self, sample_doc: PdfDocument
+    ) -> None:
+        """An intact entry hashed with an old algorithm is re-hashed in place."""
+        cache = {"test.pdf": self._legacy_entry("test.pdf")}
+
+        pruned = warm_cache(cache, [sample_doc])
+
+        assert pruned == 0
+        entry = cache["test.pdf"]
+        assert entry["hash_algo"] == HASH_ALGO
+        assert entry["file_hash"] == _compute_file_hash(sample_doc.path)
+        assert entry["size"] == sample_doc.path.stat().st_size
+        assert entry["mtime_ns"] == sample_doc.path.stat().st_mtime_ns
+
+        # The next run must start all-hit for the upgraded entry
+        retrieved = get_cached_result(cache, sample_doc)
+        assert retrieved is not None
+        assert retrieved.summary == "Legacy summary"
+
+    def test_leaves_broken_legacy_entries_alone(
+        self, sample_doc: PdfDocument
+    ) -> None:
+        """An entry whose payload can't restore is not upgraded."""
+        entry = self._legacy_entry("test.pdf")
+        del entry["summary"]
+        cache = {"test.pdf": entry}
+
+        warm_cache(cache, [sample_doc])
+
+        assert cache["test.pdf"]["hash_algo"] == "md5"
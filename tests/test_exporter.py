@@ -12,7 +12,7 @@ from gemini_pdf_analyzer.exporter import (
     export_to_json,
     export_results,
 )
-from gemini_pdf_analyzer.models import PdfAnalysisResult
+from gemini_pdf_analyzer.models import PdfAnalysisResult, ResultBatch
 
 
 @pytest.fixture
@@ -164,6 +164,49 @@ class TestExportToJson:
         assert data[0]["filename"] == "doc1.pdf"
 
 
+class TestResultBatch:
+    """Tests for the columnar ResultBatch container."""
+
+    def test_append_and_from_results_match(
+        self,
+        sample_results: list[PdfAnalysisResult],
+    ) -> None:
+        """from_results is equivalent to appending each result."""
+        appended = ResultBatch()
+        for result in sample_results:
+            appended.append(result)
+        built = ResultBatch.from_results(sample_results)
+
+        assert len(appended) == len(built) == len(sample_results)
+        assert appended.columns() == built.columns()
+
+    def test_columns_match_to_dict(
+        self,
+        sample_results: list[PdfAnalysisResult],
+    ) -> None:
+        """Batch columns carry the same values as the row-oriented export."""
+        batch = ResultBatch.from_results(sample_results)
+        records = [result.to_dict() for result in sample_results]
+
+        assert batch.filenames == [r["filename"] for r in records]
+        assert batch.keywords == [r["keywords"] for r in records]
+        assert batch.errors == [r["error"] for r in records]
+
+    def test_to_arrow(self, sample_results: list[PdfAnalysisResult]) -> None:
+        """to_arrow produces a string table in export column order."""
+        pytest.importorskip("pyarrow")
+        table = ResultBatch.from_results(sample_results).to_arrow()
+
+        assert table.num_rows == len(sample_results)
+        assert table.column_names == [
+            "filename", "summary", "key_entities",
+            "action_items", "keywords", "error",
+        ]
+        assert table.column("filename").to_pylist() == [
+            r.filename for r in sample_results
+        ]
+
+
 class TestExportResults:
     """Tests for export_results multi-format function."""
     
@@ -173,18 +216,21 @@ class TestExportResults:
         tmp_path: Path,
     ) -> None:
         """Test exporting to multiple formats at once."""
+        pytest.importorskip("pyarrow")
         output_files = export_results(
             sample_results,
             tmp_path,
-            formats=["csv", "jsonl", "excel"],
+            formats=["csv", "jsonl", "excel", "arrow"],
         )
-        
+
         assert "csv" in output_files
         assert "jsonl" in output_files
         assert "excel" in output_files
+        assert "arrow" in output_files
         assert output_files["csv"].exists()
         assert output_files["jsonl"].exists()
         assert output_files["excel"].exists()
+        assert output_files["arrow"].exists()
     
     def test_export_default_formats(
         self,
@@ -1,5 +1,6 @@
 """Tests for the PDF loader module."""
 
+import asyncio
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -7,9 +8,11 @@ import pytest
 
 from gemini_pdf_analyzer.models import PdfDocument
 from gemini_pdf_analyzer.pdf_loader import (
+    _extract_one,
     extract_text,
     list_pdf_files,
     load_pdfs,
+    load_pdfs_async,
 )
 
 
@@ -171,8 +174,120 @@ class TestLoadPdfs:
         """Test handling of PDF extraction errors."""
         mock_list.return_value = [tmp_path / "bad.pdf"]
         mock_extract.side_effect = Exception("Cannot read PDF")
-        
+
         result = load_pdfs(tmp_path, show_progress=False)
-        
+
         assert len(result) == 1
         assert result[0].text == ""
+
+
+class TestTextCache:
+    """Tests for the on-disk extracted-text cache."""
+
+    @pytest.fixture
+    def pdf_path(self, tmp_path: Path) -> Path:
+        """Create a fake PDF file to key the cache on."""
+        path = tmp_path / "doc.pdf"
+        path.write_bytes(b"fake pdf content")
+        return path
+
+    @patch("gemini_pdf_analyzer.pdf_loader.extract_text")
+    def test_cache_hit_skips_extraction(
+        self,
+        mock_extract: MagicMock,
+        pdf_path: Path,
+        tmp_path: Path,
+    ) -> None:
+        """A second extraction of an unchanged file is served from cache."""
+        cache_dir = tmp_path / "text_cache"
+        mock_extract.return_value = ("Extracted text", 3)
+
+        first = _extract_one(pdf_path, text_cache_dir=cache_dir)
+        assert first == (pdf_path, "Extracted text", 3, None)
+        assert mock_extract.call_count == 1
+
+        second = _extract_one(pdf_path, text_cache_dir=cache_dir)
+        assert second == (pdf_path, "Extracted text", 3, None)
+        # Served from cache: the parser never ran again
+        assert mock_extract.call_count == 1
+
+    @patch("gemini_pdf_analyzer.pdf_loader.extract_text")
+    def test_corrupt_cache_entry_is_ignored(
+        self,
+        mock_extract: MagicMock,
+        pdf_path: Path,
+        tmp_path: Path,
+    ) -> None:
+        """An unreadable cache file falls through to re-extraction."""
+        cache_dir = tmp_path / "text_cache"
+        mock_extract.return_value = ("Extracted text", 3)
+
+        _extract_one(pdf_path, text_cache_dir=cache_dir)
+        for entry in cache_dir.glob("*.json"):
+            entry.write_bytes(b"not json {")
+
+        result = _extract_one(pdf_path, text_cache_dir=cache_dir)
+
+        assert result == (pdf_path, "Extracted text", 3, None)
+        assert mock_extract.call_count == 2
+
+    @patch("gemini_pdf_analyzer.pdf_loader.extract_text")
+    def test_cache_write_failure_is_nonfatal(
+        self,
+        mock_extract: MagicMock,
+        pdf_path: Path,
+        tmp_path: Path,
+    ) -> None:
+        """A cache directory that can't be created doesn't fail extraction."""
+        # A regular file where the cache directory should go makes mkdir fail
+        blocked_dir = tmp_path / "blocked"
+        blocked_dir.write_bytes(b"")
+        mock_extract.return_value = ("Extracted text", 3)
+
+        result = _extract_one(pdf_path, text_cache_dir=blocked_dir)
+
+        assert result == (pdf_path, "Extracted text", 3, None)
+
+
+class TestLoadPdfsAsync:
+    """Tests for the async loading entrypoint."""
+
+    @patch("gemini_pdf_analyzer.pdf_loader.extract_text")
+    @patch("gemini_pdf_analyzer.pdf_loader.list_pdf_files")
+    def test_load_pdfs_async_success(
+        self,
+        mock_list: MagicMock,
+        mock_extract: MagicMock,
+        tmp_path: Path
+    ) -> None:
+        """Concurrent extraction yields documents in directory order."""
+        mock_list.return_value = [
+            tmp_path / "doc1.pdf",
+            tmp_path / "doc2.pdf",
+        ]
+        mock_extract.return_value = ("Sample text content", 5)
+
+        result = asyncio.run(load_pdfs_async(tmp_path))
+
+        assert [doc.filename for doc in result] == ["doc1.pdf", "doc2.pdf"]
+        assert all(isinstance(doc, PdfDocument) for doc in result)
+        assert result[0].text == "Sample text content"
+        assert result[0].page_count == 5
+
+    @patch("gemini_pdf_analyzer.pdf_loader.extract_text")
+    @patch("gemini_pdf_analyzer.pdf_loader.list_pdf_files")
+    def test_load_pdfs_async_with_max_docs(
+        self,
+        mock_list: MagicMock,
+        mock_extract: MagicMock,
+        tmp_path: Path
+    ) -> None:
+        """max_docs limits the async path like the sync one."""
+        mock_list.return_value = [
+            tmp_path / f"doc{i}.pdf" for i in range(10)
+        ]
+        mock_extract.return_value = ("Text", 1)
+
+        result = asyncio.run(load_pdfs_async(tmp_path, max_docs=3))
+
+        assert len(result) == 3